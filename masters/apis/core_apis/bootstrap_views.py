@@ -0,0 +1,54 @@
+import gzip
+import re
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from utils.bootstrap import get_bootstrap_blob
+
+__all__ = [
+    'ReferenceBootstrapAPIView'
+]
+
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+
+class ReferenceBootstrapAPIView(APIView):
+    """
+    get:
+    Return categories, services, cities, districts and languages in one
+    response. The body is built once per data version, stored gzip-compressed
+    and sent as raw bytes; serializers do not run on a cache hit.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ['get']
+
+    @swagger_auto_schema(
+        operation_summary="Bütün sorğu məlumatları bir cavabda",
+        operation_description="Kateqoriyalar, servislər, şəhərlər, rayonlar və dillər.",
+        responses={
+            200: openapi.Response('categories, services, cities, districts, languages, version'),
+            304: openapi.Response('Dəyişiklik yoxdur')
+        }
+    )
+    def get(self, request):
+        version, blob = get_bootstrap_blob()
+        use_gzip = bool(ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', '')))
+        # Sıxılmış və sıxılmamış gövdə fərqli baytlardır, validatorları da fərqli olmalıdır.
+        etag = f'"bootstrap-{version}-gz"' if use_gzip else f'"bootstrap-{version}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if use_gzip:
+                response = HttpResponse(blob, content_type='application/json')
+                response['Content-Encoding'] = 'gzip'
+            else:
+                response = HttpResponse(gzip.decompress(blob), content_type='application/json')
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept-Encoding',))
+        patch_cache_control(response, public=True, max_age=settings.REFERENCE_DATA_MAX_AGE)
+        return response
@@ -9,6 +9,7 @@ from django.conf import settings
 
 from core.models.city_model import City, District
 from core.serializers.city_serializers import CitySerializer, DistrictSerializer
+from utils.conditional import reference_data
 
 __all__ = [
     'CityListAPIView',
@@ -30,6 +31,7 @@ class CityListAPIView(APIView):
             500: openapi.Response('Internal server error.')
         }
     )
+    @reference_data('cities')
     def get(self, request):
         cache_key = 'city_list'
         cached_data = cache.get(cache_key)
@@ -58,6 +60,7 @@ class DistrictListAPIView(APIView):
             500: openapi.Response('Internal server error.')
         }
     )
+    @reference_data('districts')
     def get(self, request):
         cache_key = 'district_list'
         cached_data = cache.get(cache_key)
@@ -88,6 +91,7 @@ class DistrictListForCityAPIView(APIView):
             500: openapi.Response('Internal server error.')
         }
     )
+    @reference_data('districts')
     def get(self, request, city_id):
         cache_key = f'district_list_for_city_{city_id}'
         cached_data = cache.get(cache_key)
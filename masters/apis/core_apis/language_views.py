@@ -7,6 +7,7 @@ from django.conf import settings
 from drf_yasg.utils import swagger_auto_schema
 from core.models.language_model import Language
 from core.serializers.language_serializer import LanguageSerializer
+from utils.conditional import reference_data
 
 
 __all__ = [
@@ -29,6 +30,7 @@ class LanguageListAPIView(APIView):
         responses={200: LanguageSerializer(many=True)}
     )
 
+    @reference_data('languages')
     def get(self, request):
         cache_key = 'language_list'
         cached_data = cache.get(cache_key)
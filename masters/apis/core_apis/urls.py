@@ -1,5 +1,6 @@
 from django.urls import path
 
+from apis.core_apis.bootstrap_views import *
 from apis.core_apis.city_views import *
 from apis.core_apis.language_views import *
 
@@ -28,5 +29,11 @@ urlpatterns = [
         'languages/',
         LanguageListAPIView.as_view(),
         name='languages'
+    ),
+    # Bootstrap endpoint
+    path(
+        'bootstrap/',
+        ReferenceBootstrapAPIView.as_view(),
+        name='bootstrap'
     )
 ]
\ No newline at end of file
@@ -10,10 +10,15 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework.exceptions import ValidationError
 
-from reviews.models.review_models import Review
+from reviews.models.review_models import Review, TAG_BITS, TAG_LABELS, tags_to_mask
 from users.models.user_model import CustomUser
 from reviews.serializers.review_serializers import ReviewSerializer
-from utils.paginations import PaginationForMainPage
+from utils.paginations import (
+    CURSOR_PAGINATION_PARAMETERS,
+    PaginationForMainPage,
+    ReviewCursorPagination,
+    get_pagination
+)
 from utils.permissions import HeHasPermission
 
 logger = logging.getLogger(__name__)
@@ -23,22 +28,40 @@ __all__ = [
     'CreateReviewAPIView',
     'UpdateReviewAPIView',
     'DeleteReviewAPIView',
-    'FilterReviewAPIView'
+    'FilterReviewAPIView',
+    'ReviewTagHistogramAPIView'
 ]
 
+TAGS_PARAMETER = openapi.Parameter(
+    'tags', openapi.IN_QUERY,
+    description=f"Vergüllə ayrılmış teqlər, rəydə hamısı olmalıdır: {', '.join(TAG_LABELS)}",
+    type=openapi.TYPE_STRING
+)
+
+
+def parse_tags(value):
+    tags = [tag.strip() for tag in (value or '').split(',') if tag.strip()]
+    unknown = [tag for tag in tags if tag not in TAG_BITS]
+    if unknown:
+        raise ValidationError({'tags': f"Naməlum teq: {', '.join(unknown)}"})
+    return tags_to_mask(tags)
+
+
 class ReviewsForMasterAPIView(APIView):
     permission_classes = [AllowAny]
     pagination_class = PaginationForMainPage
+    cursor_pagination_class = ReviewCursorPagination
     http_method_names = ['get']
 
     @swagger_auto_schema(
         operation_description="Verilmiş master ID-yə aid bütün rəyləri gətirir (səhifələnmiş).",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS,
         responses={200: ReviewSerializer(many=True)},
     )
     def get(self, request, master_id):
         master = get_object_or_404(CustomUser, is_active=True, id=master_id)
-        pagination = self.pagination_class()
-        reviews = Review.objects.filter(master=master).order_by('-created_at')
+        pagination = get_pagination(request, self.pagination_class, self.cursor_pagination_class)
+        reviews = Review.objects.for_listing().filter(master=master).order_by('-created_at', '-id')
         result_page = pagination.paginate_queryset(reviews, request)
         serializer = ReviewSerializer(result_page, many=True)
         paginated_response = pagination.get_paginated_response(serializer.data).data
@@ -97,6 +120,10 @@ class CreateReviewAPIView(APIView):
                 'review_images', openapi.IN_FORM, description="Şəkillər (max 3)", type=openapi.TYPE_ARRAY,
                 items=openapi.Items(type=openapi.TYPE_FILE), maxItems=3, required=False
             ),
+            openapi.Parameter(
+                'review_image_uploads', openapi.IN_FORM, description="Birbaşa yüklənmiş şəkillərin upload_id-ləri (max 3)",
+                type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_STRING), maxItems=3, required=False
+            ),
         ],
         responses={
             201: ReviewSerializer(),
@@ -171,6 +198,10 @@ class UpdateReviewAPIView(APIView):
                 'review_images', openapi.IN_FORM, description="Şəkillər (max 3)", type=openapi.TYPE_ARRAY,
                 items=openapi.Items(type=openapi.TYPE_FILE), maxItems=3, required=False
             ),
+            openapi.Parameter(
+                'review_image_uploads', openapi.IN_FORM, description="Birbaşa yüklənmiş şəkillərin upload_id-ləri (max 3)",
+                type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_STRING), maxItems=3, required=False
+            ),
         ],
         responses={
             200: ReviewSerializer(),
@@ -208,28 +239,59 @@ class DeleteReviewAPIView(APIView):
 class FilterReviewAPIView(APIView):
     permission_classes = [AllowAny]
     pagination_class = PaginationForMainPage
+    cursor_pagination_class = ReviewCursorPagination
     http_method_names = ['get']
 
     @swagger_auto_schema(
-        operation_description="Masterə aid rəyləri `order` parametri ilə sıralayıb qaytarır.",
+        operation_description="Masterə aid rəyləri `order` parametri ilə sıralayıb, `tags` ilə süzüb qaytarır.",
         manual_parameters=[
             openapi.Parameter(
                 'order', openapi.IN_QUERY, description="'newest' və ya 'oldest'", type=openapi.TYPE_STRING
-            )
+            ),
+            TAGS_PARAMETER,
+            *CURSOR_PAGINATION_PARAMETERS
         ],
         responses={200: ReviewSerializer(many=True)}
     )
     def get(self, request, master_id):
-        pagination = self.pagination_class()
+        pagination = get_pagination(request, self.pagination_class, self.cursor_pagination_class)
         master = get_object_or_404(CustomUser, is_active=True, is_master=True, id=master_id)
         order = request.query_params.get('order', 'newest')
+        tag_mask = parse_tags(request.query_params.get('tags'))
+        reviews = Review.objects.for_listing().filter(master=master).with_tags(tag_mask)
 
         if order == 'oldest':
-            reviews = Review.objects.filter(master=master).order_by('created_at')
+            pagination.ordering = ('created_at', 'id')
+            reviews = reviews.order_by('created_at', 'id')
         else:
-            reviews = Review.objects.filter(master=master).order_by('-created_at')
+            reviews = reviews.order_by('-created_at', '-id')
 
         result_page = pagination.paginate_queryset(reviews, request)
         serializer = ReviewSerializer(result_page, many=True)
         paginated_response = pagination.get_paginated_response(serializer.data).data
         return Response(paginated_response, status=status.HTTP_200_OK)
+
+
+class ReviewTagHistogramAPIView(APIView):
+    """
+    get:
+    Number of reviews per tag for a master, optionally among the reviews
+    that already carry the tags given in `tags`.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ['get']
+
+    @swagger_auto_schema(
+        operation_description="Masterin rəylərində hər teqin neçə dəfə seçildiyini qaytarır.",
+        manual_parameters=[TAGS_PARAMETER],
+        responses={200: openapi.Response('Teqlər üzrə rəy sayı')}
+    )
+    def get(self, request, master_id):
+        master = get_object_or_404(CustomUser, is_active=True, is_master=True, id=master_id)
+        tag_mask = parse_tags(request.query_params.get('tags'))
+        histogram = Review.objects.filter(master=master).with_tags(tag_mask).tag_histogram()
+        data = [
+            {'tag': field, 'label': label, 'count': histogram[field]}
+            for field, label in TAG_LABELS.items()
+        ]
+        return Response(data, status=status.HTTP_200_OK)
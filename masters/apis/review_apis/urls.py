@@ -34,5 +34,11 @@ urlpatterns = [
         'professionals/<int:master_id>/reviews/filter/',
         FilterReviewAPIView.as_view(),
         name='filter-reviews'
+    ),
+
+    path(
+        'professionals/<int:master_id>/reviews/tags/',
+        ReviewTagHistogramAPIView.as_view(),
+        name='review-tags'
     )
 ]
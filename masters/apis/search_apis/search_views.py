@@ -1,31 +1,64 @@
-import hashlib
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Q, Avg
-from django.db.models.functions import Coalesce
+from django.db.models import Count, Exists, F, OuterRef
 from django.core.cache import cache
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.views import APIView
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from users.models.user_model import CustomUser
 from users.serializers.user_serializers import CustomUserSerializer
+from utils.geo import annotate_distance, filter_nearby, nearby_distances
 from utils.paginations import CustomPagination
+from utils.autocomplete import (
+    AUTOCOMPLETE_MAX_LIMIT,
+    autocomplete,
+    empty_suggestions,
+    is_autocomplete_index_built,
+    schedule_autocomplete_rebuild
+)
+from utils.search import parse_id_list, parse_number, search_masters
+from utils.search_cache import (
+    SEARCH_CACHE_TIMEOUT,
+    build_search_cache_key,
+    canonical_search_params,
+    facet_tags,
+    get_search_cache_stats,
+    record_search_cache_hit
+)
+
+
+__all__ = [
+    'SearchAPIView',
+    'SearchFacetsAPIView',
+    'AutocompleteAPIView',
+    'SearchCacheStatsAPIView',
+]
 
 
 class SearchAPIView(ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = CustomUserSerializer
     pagination_class = CustomPagination
+    stored_orderings = {
+        'rating': ('rating_summary__avg_rating', 'rating_summary__rating_count', 'id'),
+        'score': ('rating_summary__ranking_score', 'id'),
+    }
 
-    search_param = openapi.Parameter('search', openapi.IN_QUERY, description="Search query", type=openapi.TYPE_STRING)
+    search_param = openapi.Parameter('search', openapi.IN_QUERY, description="Search query (ranked full-text, typo tolerant)", type=openapi.TYPE_STRING)
     profession_area_id_param = openapi.Parameter('profession_area_id', openapi.IN_QUERY, description="Profession area", type=openapi.TYPE_INTEGER)
     profession_speciality_id_param = openapi.Parameter('profession_speciality_id', openapi.IN_QUERY, description="Profession speciality", type=openapi.TYPE_INTEGER)
-    city_id_param = openapi.Parameter('city_id', openapi.IN_QUERY, description="City ID", type=openapi.TYPE_INTEGER)
-    language_id_param = openapi.Parameter('language_id', openapi.IN_QUERY, description="Language ID", type=openapi.TYPE_INTEGER)
+    city_id_param = openapi.Parameter('city_id', openapi.IN_QUERY, description="City IDs, comma separated (e.g. 1,2,3)", type=openapi.TYPE_STRING)
+    language_id_param = openapi.Parameter('language_id', openapi.IN_QUERY, description="Language IDs, comma separated", type=openapi.TYPE_STRING)
     education_param = openapi.Parameter('education', openapi.IN_QUERY, description="Education level", type=openapi.TYPE_STRING)
     experience_years_param = openapi.Parameter('experience_years', openapi.IN_QUERY, description="Experience years", type=openapi.TYPE_INTEGER)
+    experience_min_param = openapi.Parameter('experience_min', openapi.IN_QUERY, description="Minimum experience years", type=openapi.TYPE_INTEGER)
+    experience_max_param = openapi.Parameter('experience_max', openapi.IN_QUERY, description="Maximum experience years", type=openapi.TYPE_INTEGER)
+    min_rating_param = openapi.Parameter('min_rating', openapi.IN_QUERY, description="Minimum average rating", type=openapi.TYPE_NUMBER)
+    near_city_id_param = openapi.Parameter('near_city_id', openapi.IN_QUERY, description="Masters near this city (within PROXIMITY_RADIUS_KM), sorted by distance unless ordering is given", type=openapi.TYPE_INTEGER)
+    near_district_id_param = openapi.Parameter('near_district_id', openapi.IN_QUERY, description="Masters near this district (within PROXIMITY_RADIUS_KM), sorted by distance unless ordering is given; takes precedence over near_city_id", type=openapi.TYPE_INTEGER)
     ordering_param = openapi.Parameter('ordering', openapi.IN_QUERY, description="Order by field", type=openapi.TYPE_STRING)
     page_param = openapi.Parameter('page', openapi.IN_QUERY, description="Page number", type=openapi.TYPE_INTEGER)
     page_size_param = openapi.Parameter('page_size', openapi.IN_QUERY, description="Page size", type=openapi.TYPE_INTEGER)
@@ -39,6 +72,11 @@ class SearchAPIView(ListAPIView):
             language_id_param,
             education_param,
             experience_years_param,
+            experience_min_param,
+            experience_max_param,
+            min_rating_param,
+            near_city_id_param,
+            near_district_id_param,
             ordering_param,
             page_param,
             page_size_param
@@ -47,22 +85,24 @@ class SearchAPIView(ListAPIView):
         operation_description="Search with filters and keywords"
     )
     def get(self, request, *args, **kwargs):
-        query_params = request.GET.urlencode()
-        cache_key = f'search_{hashlib.md5(query_params.encode()).hexdigest()}'
+        params = canonical_search_params(request.query_params, self.paginator)
+        cache_key = build_search_cache_key(params)
         cached_data = cache.get(cache_key)
 
         if cached_data:
             if isinstance(cached_data, dict):
+                record_search_cache_hit(True)
                 return Response(cached_data, status=status.HTTP_200_OK)
             else:
                 cache.delete(cache_key)
 
+        record_search_cache_hit(False)
         queryset = self.get_queryset()
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             paginated_response = self.get_paginated_response(serializer.data)
-            cache.set(cache_key, paginated_response.data, timeout=250)
+            cache.set(cache_key, paginated_response.data, timeout=SEARCH_CACHE_TIMEOUT)
             return paginated_response
 
         serializer = self.get_serializer(queryset, many=True)
@@ -71,27 +111,72 @@ class SearchAPIView(ListAPIView):
     def get_queryset(self):
         request = self.request
         search_query = request.query_params.get('search', '')
-        profession_area_id = request.query_params.get('profession_area_id')
-        profession_speciality_id = request.query_params.get('profession_speciality_id')
-        city_id = request.query_params.get('city_id')
-        language_id = request.query_params.get('language_id')
-        education = request.query_params.get('education')
-        experience_years = request.query_params.get('experience_years')
         ordering = request.query_params.get('ordering', '-id')
 
-        allowed_ordering_fields = ['id', 'first_name', 'last_name', 'experience_years', 'created_at', 'rating']
+        allowed_ordering_fields = ['id', 'first_name', 'last_name', 'experience_years', 'created_at', 'rating', 'score']
         if ordering.lstrip('-') not in allowed_ordering_fields:
             ordering = '-id'
 
-        queryset = CustomUser.objects.filter(is_active=True, is_master=True)
+        queryset = self.apply_filters(
+            CustomUser.objects.active_masters().for_master_card(),
+            request.query_params
+        )
+
+        if 'ordering' not in request.query_params:
+            # Radius filtri apply_filters-dədir; açıq ordering verilməyibsə məsafəyə görə sıralanır.
+            distances = self.get_proximity(request.query_params)
+            if distances is not None:
+                secondary = ('-search_rank', '-id') if search_query else ('-id',)
+                return annotate_distance(queryset, distances).order_by(
+                    F('distance_km').asc(nulls_last=True), *secondary
+                )
+
+        if search_query and 'ordering' not in request.query_params:
+            return queryset.order_by('-search_rank', '-id')
+
+        field = ordering.lstrip('-')
+        if field in self.stored_orderings:
+            # Saxlanılmış sütunlar üzrə sıralama reviews cədvəlinə toxunmur
+            # və reviews_rating_rank_idx / reviews_ranking_score_idx indeksi ilə oxunur.
+            direction = '-' if ordering.startswith('-') else ''
+            return queryset.order_by(*[f'{direction}{name}' for name in self.stored_orderings[field]])
+
+        return queryset.order_by(ordering)
+
+    def get_proximity(self, query_params):
+        """
+        Nearby locations of near_district_id, or of near_city_id when the
+        district is missing or has no coordinates; None without an origin.
+        """
+        district_id = parse_number(query_params.get('near_district_id'))
+        if district_id is not None:
+            distances = nearby_distances('district', district_id)
+            if distances is not None:
+                return distances
+        city_id = parse_number(query_params.get('near_city_id'))
+        if city_id is not None:
+            return nearby_distances('city', city_id)
+        return None
+
+    def apply_filters(self, queryset, query_params):
+        search_query = query_params.get('search', '')
+        profession_area_id = query_params.get('profession_area_id')
+        profession_speciality_id = query_params.get('profession_speciality_id')
+        city_ids = parse_id_list(query_params, 'city_id')
+        language_ids = parse_id_list(query_params, 'language_id')
+        education = query_params.get('education')
+        experience_years = query_params.get('experience_years')
+        experience_min = parse_number(query_params.get('experience_min'))
+        experience_max = parse_number(query_params.get('experience_max'))
+        min_rating = parse_number(query_params.get('min_rating'), float)
 
         if search_query:
-            queryset = queryset.filter(
-                Q(first_name__icontains=search_query) |
-                Q(last_name__icontains=search_query) |
-                Q(custom_profession__icontains=search_query) |
-                Q(education_speciality__icontains=search_query)
-            )
+            queryset = search_masters(queryset, search_query)
+
+        # Yaxınlıq həm sıralamada, həm də ordering və faset sorğularında filtr kimi tətbiq olunur.
+        distances = self.get_proximity(query_params)
+        if distances is not None:
+            queryset = filter_nearby(queryset, distances)
 
         if profession_area_id:
             queryset = queryset.filter(profession_area_id=profession_area_id)
@@ -99,11 +184,16 @@ class SearchAPIView(ListAPIView):
         if profession_speciality_id:
             queryset = queryset.filter(profession_speciality_id=profession_speciality_id)
 
-        if city_id:
-            queryset = queryset.filter(cities__id=city_id)
+        # EXISTS join-dən fərqli olaraq bir neçə şəhərə uyğun ustanı təkrarlamır.
+        if city_ids:
+            queryset = queryset.filter(Exists(CustomUser.cities.through.objects.filter(
+                customuser_id=OuterRef('pk'), city_id__in=city_ids
+            )))
 
-        if language_id:
-            queryset = queryset.filter(languages__id=language_id)
+        if language_ids:
+            queryset = queryset.filter(Exists(CustomUser.languages.through.objects.filter(
+                customuser_id=OuterRef('pk'), language_id__in=language_ids
+            )))
 
         if education:
             queryset = queryset.filter(education=education)
@@ -114,7 +204,159 @@ class SearchAPIView(ListAPIView):
             except ValueError:
                 pass
 
-        if ordering.lstrip('-') == 'rating':
-            queryset = queryset.annotate(rating=Coalesce(Avg('reviews__rating'), 0))
+        if experience_min is not None:
+            queryset = queryset.filter(experience_years__gte=experience_min)
 
-        return queryset.order_by(ordering)
+        if experience_max is not None:
+            queryset = queryset.filter(experience_years__lte=experience_max)
+
+        if min_rating is not None:
+            queryset = queryset.filter(
+                rating_summary__rating_count__gt=0,
+                rating_summary__avg_rating__gte=min_rating
+            )
+
+        return queryset
+
+
+class SearchFacetsAPIView(SearchAPIView):
+    """
+    get:
+    Return per-facet master counts (cities, languages, education, profession area)
+    for the current search filters.
+
+    Each facet is counted with every filter applied except its own, so the
+    sidebar also shows how many masters the other values of that facet would give.
+    """
+    facet_params = {
+        'cities': 'city_id',
+        'languages': 'language_id',
+        'education': 'education',
+        'profession_areas': 'profession_area_id',
+    }
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            SearchAPIView.search_param,
+            SearchAPIView.profession_area_id_param,
+            SearchAPIView.profession_speciality_id_param,
+            SearchAPIView.city_id_param,
+            SearchAPIView.language_id_param,
+            SearchAPIView.education_param,
+            SearchAPIView.experience_years_param,
+            SearchAPIView.experience_min_param,
+            SearchAPIView.experience_max_param,
+            SearchAPIView.min_rating_param,
+            SearchAPIView.near_city_id_param,
+            SearchAPIView.near_district_id_param,
+        ],
+        operation_summary="Axtarış filtrləri üzrə say",
+        operation_description="Cari axtarış nəticəsi üçün şəhər, dil, təhsil və peşə sahəsi üzrə usta sayları."
+    )
+    def get(self, request, *args, **kwargs):
+        params = canonical_search_params(request.query_params, self.paginator)
+        for param in ('page', 'page_size', 'ordering'):
+            params.pop(param, None)
+        cache_key = build_search_cache_key(params, tags=facet_tags(params), prefix='search_facets')
+        cached_data = cache.get(cache_key)
+        if cached_data:
+            record_search_cache_hit(True)
+            return Response(cached_data, status=status.HTTP_200_OK)
+
+        record_search_cache_hit(False)
+        data = {
+            'total': self.get_master_ids(request.query_params).count(),
+            'cities': self.count_related(CustomUser.cities.through, 'city', 'cities', request),
+            'languages': self.count_related(CustomUser.languages.through, 'language', 'languages', request),
+            'education': self.count_education(request),
+            'profession_areas': self.count_profession_areas(request),
+        }
+        cache.set(cache_key, data, timeout=SEARCH_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_master_ids(self, query_params, facet=None):
+        if facet is not None:
+            query_params = query_params.copy()
+            query_params.pop(self.facet_params[facet], None)
+        return self.apply_filters(CustomUser.objects.active_masters(), query_params).values('pk')
+
+    def count_related(self, through, field, facet, request):
+        rows = through.objects.filter(
+            customuser_id__in=self.get_master_ids(request.query_params, facet)
+        ).values(
+            f'{field}_id', f'{field}__display_name'
+        ).annotate(count=Count('customuser_id')).order_by('-count', f'{field}__display_name')
+        return [
+            {'id': row[f'{field}_id'], 'name': row[f'{field}__display_name'], 'count': row['count']}
+            for row in rows
+        ]
+
+    def count_education(self, request):
+        labels = dict(CustomUser.EDUCATION_CHOICES)
+        rows = CustomUser.objects.filter(
+            pk__in=self.get_master_ids(request.query_params, 'education')
+        ).values('education').annotate(count=Count('pk')).order_by('-count', 'education')
+        return [
+            {'value': row['education'], 'name': labels.get(row['education'], row['education']), 'count': row['count']}
+            for row in rows
+        ]
+
+    def count_profession_areas(self, request):
+        rows = CustomUser.objects.filter(
+            pk__in=self.get_master_ids(request.query_params, 'profession_areas')
+        ).values(
+            'profession_area_id', 'profession_area__display_name'
+        ).annotate(count=Count('pk')).order_by('-count', 'profession_area__display_name')
+        return [
+            {'id': row['profession_area_id'], 'name': row['profession_area__display_name'], 'count': row['count']}
+            for row in rows
+            if row['profession_area_id'] is not None
+        ]
+
+
+class AutocompleteAPIView(APIView):
+    """
+    get:
+    Suggest masters, services and categories whose names start with the typed prefix.
+
+    Served from the Redis prefix index, so it is cheap enough to call on every keystroke.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ['get']
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, description="Yazılan prefiks", type=openapi.TYPE_STRING),
+            openapi.Parameter('limit', openapi.IN_QUERY, description="Hər növ üçün maksimum təklif sayı (1-10)", type=openapi.TYPE_INTEGER),
+        ],
+        operation_summary="Axtarış üçün avtomatik tamamlama",
+        operation_description="Usta adları, xidmətlər və kateqoriyalar üzrə prefiks təklifləri."
+    )
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', 5))
+        except ValueError:
+            limit = 5
+        limit = max(1, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+
+        if not is_autocomplete_index_built():
+            # İndeks fonda qurulana qədər boş təkliflər qaytarılır.
+            schedule_autocomplete_rebuild()
+            return Response(empty_suggestions(), status=status.HTTP_200_OK)
+        return Response(autocomplete(request.query_params.get('q', ''), limit), status=status.HTTP_200_OK)
+
+
+class SearchCacheStatsAPIView(APIView):
+    """
+    get:
+    Return hit and miss counters of the search response cache.
+    """
+    permission_classes = [IsAdminUser]
+    http_method_names = ['get']
+
+    @swagger_auto_schema(
+        operation_summary="Axtarış keşinin statistikası",
+        operation_description="Axtarış keşinə düşən və düşməyən sorğuların sayı (yalnız adminlər üçün)."
+    )
+    def get(self, request):
+        return Response(get_search_cache_stats(), status=status.HTTP_200_OK)
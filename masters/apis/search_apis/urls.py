@@ -1,5 +1,10 @@
 from django.urls import path
-from apis.search_apis.search_views import SearchAPIView
+from apis.search_apis.search_views import (
+    AutocompleteAPIView,
+    SearchAPIView,
+    SearchCacheStatsAPIView,
+    SearchFacetsAPIView
+)
 
 app_name = 'search_apis'
 
@@ -9,4 +14,19 @@ urlpatterns = [
         SearchAPIView.as_view(),
         name='professionals-search'
     ),
+    path(
+        'professionals/search/facets/', 
+        SearchFacetsAPIView.as_view(),
+        name='professionals-search-facets'
+    ),
+    path(
+        'professionals/search/autocomplete/', 
+        AutocompleteAPIView.as_view(),
+        name='professionals-search-autocomplete'
+    ),
+    path(
+        'professionals/search/cache-stats/', 
+        SearchCacheStatsAPIView.as_view(),
+        name='professionals-search-cache-stats'
+    ),
 ]
\ No newline at end of file
@@ -8,6 +8,8 @@ from drf_yasg.utils import swagger_auto_schema
 
 from services.models.category_model import Category
 from services.serializers.category_serializer import CategorySerializer
+from utils.conditional import reference_data
+from utils.cache_versions import category_masters_namespace, get_cache_version
 from utils.paginations import CustomPagination
 from users.models.user_model import CustomUser
 from users.serializers.user_serializers import CustomUserSerializer
@@ -38,6 +40,7 @@ class CategoryListAPIView(APIView):
         responses={200: CategorySerializer(many=True)}
     )
 
+    @reference_data('categories')
     def get(self, request):
         cache_key = f'category_list'
         cached_data = cache.get(cache_key)
@@ -80,11 +83,17 @@ class MasterListForCategoryAPIView(APIView):
     def get(self, request, category_id):
         pagination = self.pagination_class()
         category = get_object_or_404(Category, id=category_id)
-        masters = CustomUser.objects.filter(
-            profession_area=category,
-            is_active=True, 
-            is_master=True
-            )
+        version = get_cache_version(category_masters_namespace(category.id))
+        page = request.query_params.get(pagination.page_query_param, 1)
+        page_size = pagination.get_page_size(request)
+        cache_key = f'category_masters_{category.id}_v{version}_page_{page}_size_{page_size}'
+        cached_data = cache.get(cache_key)
+        if cached_data:
+            return Response(cached_data, status=status.HTTP_200_OK)
+
+        masters = CustomUser.objects.active_masters().for_master_card().filter(
+            profession_area=category
+            ).order_by('-created_at', '-id')
         if not masters.exists():
             return Response({
                 'error': 'Hal-hazırda bu kateqoriyaya uyğun aktiv bir usta yoxdur'
@@ -92,4 +101,5 @@ class MasterListForCategoryAPIView(APIView):
         result_page = pagination.paginate_queryset(masters, request)
         serializer = CustomUserSerializer(result_page, many=True)
         paginated_response = pagination.get_paginated_response(serializer.data).data
-        return Response(paginated_response, status=status.HTTP_200_OK)
\ No newline at end of file
+        cache.set(cache_key, paginated_response, timeout=settings.TIMEOUT)
+        return Response(paginated_response, status=status.HTTP_200_OK)
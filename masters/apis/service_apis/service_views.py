@@ -5,7 +5,6 @@ from django.shortcuts import get_object_or_404
 from django.core.cache import cache
 from django.conf import settings
 from drf_yasg.utils import swagger_auto_schema
-from django.db.models import Avg
 from rest_framework.decorators import api_view, permission_classes
 from drf_yasg import openapi
 
@@ -14,8 +13,9 @@ from services.models.service_model import Service
 from services.serializers.service_serializer import ServiceSerializer
 from users.models.user_model import CustomUser
 from users.serializers.user_serializers import CustomUserSerializer
+from utils.conditional import reference_data
 from utils.paginations import CustomPagination
-from reviews.models.review_models import Review
+from utils.statistics import get_statistics
 
 __all__ = [
     'ServicesForCategoryAPIView',
@@ -43,6 +43,7 @@ class ServiceListAPIView(APIView):
         responses={200: ServiceSerializer(many=True)}
     )
 
+    @reference_data('services')
     def get(self, request):
         cache_key = f'services_list'
         cached_data = cache.get(cache_key)
@@ -78,6 +79,7 @@ class ServicesForCategoryAPIView(APIView):
         responses={200: ServiceSerializer(many=True)}
     )
 
+    @reference_data('services')
     def get(self, request, category_id):
         cache_key = f'services_for_category_{category_id}'
         cached_data = cache.get(cache_key)
@@ -117,11 +119,9 @@ class MasterListForServicesAPIView(APIView):
     def get(self, request, service_id):
         pagination = self.pagination_class()
         service = get_object_or_404(Service, id=service_id)
-        masters = CustomUser.objects.filter(
-            profession_speciality=service, 
-            is_active=True, 
-            is_master=True
-            )
+        masters = CustomUser.objects.active_masters().for_master_card().filter(
+            profession_speciality=service
+            ).order_by('-created_at')
         if not masters.exists():
             return Response({
                 'error': 'Hal-hazırda bu servisə uyğun aktiv bir usta yoxdur'
@@ -152,11 +152,14 @@ class MasterListForServicesAPIView(APIView):
     }
 )
 def statistics_view(request):
-    master_count = CustomUser.objects.filter(is_active=True, is_master=True).count()
-    
-    category_count = Category.objects.count()
-    
-    avg_rating = Review.objects.aggregate(avg=Avg('rating'))['avg'] or 0.0
+    statistics = get_statistics()
+    master_count = statistics['master_count']
+    category_count = statistics['category_count']
+
+    if statistics['rating_count']:
+        avg_rating = statistics['rating_sum'] / statistics['rating_count']
+    else:
+        avg_rating = 0.0
     if avg_rating > 5:
         avg_rating = 5
 
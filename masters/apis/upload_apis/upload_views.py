@@ -0,0 +1,91 @@
+import tempfile
+
+from django.core.files import File
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView, status
+
+from core.serializers.upload_serializer import UploadSlotSerializer
+from utils.uploads import LocalUploadBackend, create_upload_slot, get_upload_backend, get_upload_slot
+
+__all__ = [
+    'CreateUploadSlotAPIView',
+    'UploadFileAPIView'
+]
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class CreateUploadSlotAPIView(APIView):
+    """
+    post:
+    Reserve an upload slot. The client sends the file straight to the
+    returned URL and later passes `upload_id` to the register, profile
+    update or review endpoints instead of the file itself.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ['post']
+
+    @swagger_auto_schema(
+        operation_summary="Şəkil yükləmək üçün yer ayır",
+        operation_description="Faylı birbaşa yaddaşa yükləmək üçün URL və `upload_id` qaytarır.",
+        request_body=UploadSlotSerializer,
+        responses={
+            201: openapi.Response('upload_id, method, url, fields, expires_in'),
+            400: openapi.Response('Səhv məlumat')
+        }
+    )
+    def post(self, request):
+        serializer = UploadSlotSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        slot = create_upload_slot(
+            serializer.validated_data['kind'],
+            serializer.validated_data['filename'],
+            serializer.validated_data['size'],
+            request
+        )
+        return Response(slot, status=status.HTTP_201_CREATED)
+
+
+class UploadFileAPIView(APIView):
+    """
+    put:
+    Receive the file of an upload slot. Only used by the local stand-in
+    backend; with S3 the file never reaches the application.
+    """
+    permission_classes = [AllowAny]
+    http_method_names = ['put']
+
+    @swagger_auto_schema(
+        operation_summary="Faylı yüklə (yalnız lokal yaddaş)",
+        responses={
+            204: openapi.Response('Fayl qəbul edildi'),
+            400: openapi.Response('Fayl boşdur'),
+            404: openapi.Response('Yükləmə tapılmadı'),
+            413: openapi.Response('Fayl çox böyükdür')
+        }
+    )
+    def put(self, request, upload_id):
+        backend = get_upload_backend()
+        slot = get_upload_slot(upload_id)
+        if not isinstance(backend, LocalUploadBackend) or slot is None:
+            return Response({'error': 'Yükləmə tapılmadı'}, status=status.HTTP_404_NOT_FOUND)
+        # Content-Length: 0 olduqda DRF stream yaratmır.
+        if request.stream is None:
+            return Response({'error': 'Fayl boşdur'}, status=status.HTTP_400_BAD_REQUEST)
+
+        size = 0
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as content:
+            # Gövdə hissə-hissə oxunur, limitdən böyük fayl yaddaşa yığılmır.
+            for chunk in iter(lambda: request.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                size += len(chunk)
+                if size > slot['max_size']:
+                    return Response({'error': 'Şəkil 5 MB-dan böyük ola bilməz.'}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+                content.write(chunk)
+            if not size:
+                return Response({'error': 'Fayl boşdur'}, status=status.HTTP_400_BAD_REQUEST)
+            content.seek(0)
+            backend.receive(slot, File(content))
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,19 @@
+from django.urls import path
+
+from apis.upload_apis.upload_views import *
+
+
+app_name = 'upload_apis'
+
+urlpatterns = [
+    path(
+        'uploads/',
+        CreateUploadSlotAPIView.as_view(),
+        name='upload-slots'
+    ),
+    path(
+        'uploads/<str:upload_id>/file/',
+        UploadFileAPIView.as_view(),
+        name='upload-file'
+    )
+]
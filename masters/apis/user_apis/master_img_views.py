@@ -1,4 +1,4 @@
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from rest_framework.views import APIView, status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
@@ -8,10 +8,11 @@ from rest_framework.parsers import JSONParser, MultiPartParser
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from users.models.user_model import CustomUser
 from users.models.work_image_model import WorkImage
 from users.serializers.work_image_serializers import WorkImageSerializer
+from utils.conditional import conditional_response
 from utils.permissions import HeHasPermission
+from utils.profiles import get_work_images_entry
 
 __all__ = [
     'WorkImagesForMasterAPIView',
@@ -37,10 +38,10 @@ class WorkImagesForMasterAPIView(APIView):
     )
     
     def get(self, request, master_id):
-        master = get_object_or_404(CustomUser, id=master_id)
-        images = master.work_images.all() 
-        serializer = WorkImageSerializer(images, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        entry = get_work_images_entry(master_id)
+        if entry is None:
+            raise Http404
+        return conditional_response(request, entry, no_cache=True)
 
 
 class DeleteMasterWorkImageAPIView(APIView):
@@ -1,17 +1,27 @@
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from rest_framework.views import APIView, status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Q, Avg, Count
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
 from users.models.user_model import CustomUser
 from users.serializers.user_serializers import CustomUserSerializer
 from users.serializers.profile_serializers import ProfileSerializer
-from utils.paginations import CustomPagination, PaginationForMainPage
+from utils.leaderboard import get_top_masters_leaderboard
+from utils.conditional import conditional_response
+from utils.profiles import get_profile_entry
+from utils.paginations import (
+    CURSOR_PAGINATION_PARAMETERS,
+    CustomPagination,
+    MasterCursorPagination,
+    PaginationForMainPage,
+    TopRatedCursorPagination,
+    get_pagination,
+    is_cursor_request
+)
 
 
 __all__ = [
@@ -29,20 +39,19 @@ class MastersListAPIView(APIView):
     """
     permission_classes = [AllowAny]
     pagination_class = CustomPagination
+    cursor_pagination_class = MasterCursorPagination
     http_method_names = ['get']
     
     @swagger_auto_schema(
         operation_summary="Aktiv ustaların siyahısı",
         operation_description="Orta reytinq və rəy sayı ilə birlikdə aktiv ustaları göstərir.",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS,
         responses={200: CustomUserSerializer(many=True)}
     )
 
     def get(self, request):
-        pagination = self.pagination_class()
-        masters = CustomUser.objects.annotate(
-            avg_rating=Avg('reviews__rating'),
-            count_ratings=Count('reviews')
-        ).filter(is_active=True, is_master=True).order_by('-created_at')
+        pagination = get_pagination(request, self.pagination_class, self.cursor_pagination_class)
+        masters = CustomUser.objects.active_masters().for_master_card().order_by('-created_at')
         
         if not masters.exists():
             return Response({
@@ -57,26 +66,33 @@ class MastersListAPIView(APIView):
 class TopRatedMastersListAPIView(APIView):
     """
     get:
-    Return a list of top-rated active masters sorted by rating, review count, and last login.
+    Return a list of top-rated active masters sorted by the weighted ranking score, review count, and last login.
     """
     permission_classes = [AllowAny]
     pagination_class = PaginationForMainPage
+    cursor_pagination_class = TopRatedCursorPagination
     http_method_names = ['get']
     
     @swagger_auto_schema(
         operation_summary="Ən yüksək reytinqli ustalar",
-        operation_description="Reytinqə, rəy sayına və son daxil olmağa görə sıralanmış aktiv ustalar.",
+        operation_description="Çəkili reytinq balına, rəy sayına və son daxil olmağa görə sıralanmış aktiv ustalar.",
+        manual_parameters=CURSOR_PAGINATION_PARAMETERS,
         responses={200: CustomUserSerializer(many=True)}
     )
 
     def get(self, request):
-        pagination = self.pagination_class()
-        masters = CustomUser.objects.annotate(
-            avg_rating=Avg('reviews__rating'),
-            count_ratings=Count('reviews')
-        ).filter(is_active=True, is_master=True).order_by('-avg_rating', '-count_ratings', '-last_login')
+        if is_cursor_request(request):
+            # Kursor rejimi reytinq cədvəli ilə eyni açarlar (bal, rəy sayı, son giriş) üzrə irəliləyir.
+            pagination = self.cursor_pagination_class()
+            masters = CustomUser.objects.active_masters().for_master_card()
+            has_masters = masters.exists()
+        else:
+            # Səhifə rejimi Redis-dəki hazır reytinq cədvəlindən oxuyur.
+            pagination = self.pagination_class()
+            masters = get_top_masters_leaderboard()
+            has_masters = masters.count() > 0
         
-        if not masters.exists():
+        if not has_masters:
             return Response({
                 'error': 'Hal-hazırda aktiv bir usta yoxdur'
             }, status=status.HTTP_404_NOT_FOUND)
@@ -107,9 +123,11 @@ class MasterDetailAPIView(APIView):
     )
 
     def get(self, request, master_id):
-        master = get_object_or_404(CustomUser, id=master_id, is_active=True)
-        serializer = ProfileSerializer(master)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Şərti sorğular (If-None-Match / If-Modified-Since) keşdən cavablanır.
+        entry = get_profile_entry(master_id)
+        if entry is None:
+            raise Http404
+        return conditional_response(request, entry, no_cache=True)
 
 
 
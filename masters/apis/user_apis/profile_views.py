@@ -9,6 +9,7 @@ from drf_yasg import openapi
 
 from users.serializers.profile_serializers import ProfileSerializer, ProfileUpdateSerializer
 from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+from utils.profiles import get_profile_data
 
 
 __all__ = [
@@ -37,8 +38,7 @@ class ProfileAPIView(APIView):
     )
 
     def get(self, request):
-        serializer = ProfileSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(get_profile_data(request.user.pk), status=status.HTTP_200_OK)
     
 
 class ProfileUpdateAPIView(APIView):
@@ -68,6 +68,8 @@ class ProfileUpdateAPIView(APIView):
             openapi.Parameter('districts', openapi.IN_FORM, type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_INTEGER), description="Rayonların ID-ləri", collectionFormat='multi', required=False),
             openapi.Parameter('languages', openapi.IN_FORM, type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_INTEGER), description="Dillərin ID-ləri", collectionFormat='multi', required=False),
             openapi.Parameter('work_images', openapi.IN_FORM, type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_FILE), description="İş şəkilləri", collectionFormat='multi', required=False),
+            openapi.Parameter('work_image_uploads', openapi.IN_FORM, type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_STRING), description="Birbaşa yüklənmiş iş şəkillərinin upload_id-ləri", collectionFormat='multi', required=False),
+            openapi.Parameter('profile_image_upload', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Birbaşa yüklənmiş profil şəklinin upload_id-si", required=False),
             openapi.Parameter('profile_image', openapi.IN_FORM, type=openapi.TYPE_FILE, description="Profil şəkli", required=False),
             openapi.Parameter('facebook', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Facebook URL", required=False),
             openapi.Parameter('instagram', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Instagram URL", required=False),
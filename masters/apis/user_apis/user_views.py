@@ -93,6 +93,8 @@ class RegisterAPIView(APIView):
             openapi.Parameter('education_speciality', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Təhsil ixtisası", required=False),
             openapi.Parameter('profile_image', openapi.IN_FORM, type=openapi.TYPE_FILE, description="Profil şəkli", required=False),
             openapi.Parameter('work_images', openapi.IN_FORM, type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_FILE), description="İş şəkilləri", collectionFormat='multi', required=False),
+            openapi.Parameter('work_image_uploads', openapi.IN_FORM, type=openapi.TYPE_ARRAY, items=openapi.Items(type=openapi.TYPE_STRING), description="Birbaşa yüklənmiş iş şəkillərinin upload_id-ləri", collectionFormat='multi', required=False),
+            openapi.Parameter('profile_image_upload', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Birbaşa yüklənmiş profil şəklinin upload_id-si", required=False),
             openapi.Parameter('facebook', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Facebook URL", required=False),
             openapi.Parameter('instagram', openapi.IN_FORM, type=openapi.TYPE_STRING, description="Instagram URL", required=False),
             openapi.Parameter('tiktok', openapi.IN_FORM, type=openapi.TYPE_STRING, description="TikTok URL", required=False),
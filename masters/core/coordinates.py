@@ -0,0 +1,93 @@
+# Şəhər və rayon mərkəzlərinin təxmini koordinatları (enlik, uzunluq).
+# Açarlar City.name / District.name dəyərləri ilə eynidir.
+
+CITY_COORDINATES = {
+    "baku": (40.4093, 49.8671),
+    "nakhchivan": (39.2089, 45.4122),
+    "sumqayit": (40.5897, 49.6686),
+    "lenkeran": (38.7529, 48.8475),
+    "mingechevir": (40.7703, 47.0496),
+    "naftalan": (40.5067, 46.8250),
+    "khankendi": (39.8153, 46.7519),
+    "shirvan": (39.9317, 48.9206),
+    "yevlakh": (40.6197, 47.1500),
+    "absheron": (40.4483, 49.7553),
+    "agcabedi": (40.0528, 47.4611),
+    "agdam": (39.9911, 46.9297),
+    "agdash": (40.6469, 47.4761),
+    "aghdara": (40.2133, 46.8142),
+    "agstafa": (41.1189, 45.4539),
+    "agsu": (40.5708, 48.4008),
+    "astara": (38.4560, 48.8750),
+    "babek": (39.1508, 45.4486),
+    "balakan": (41.7258, 46.4083),
+    "beylagan": (39.7756, 47.6186),
+    "barda": (40.3744, 47.1267),
+    "bilesuvar": (39.4589, 48.5450),
+    "jabrayil": (39.4000, 47.0267),
+    "jalilabad": (39.2089, 48.4972),
+    "julfa": (38.9558, 45.6308),
+    "dashkasan": (40.5203, 46.0781),
+    "fuzuli": (39.6003, 47.1431),
+    "gadebay": (40.5700, 45.8108),
+    "goranboy": (40.6103, 46.7897),
+    "goychay": (40.6531, 47.7406),
+    "goygol": (40.5858, 46.3189),
+    "hajigabul": (40.0394, 48.9203),
+    "khachmaz": (41.4636, 48.8056),
+    "khizi": (40.9108, 49.0739),
+    "khocali": (39.9133, 46.7903),
+    "khocavend": (39.7947, 47.1131),
+    "imishli": (39.8697, 48.0597),
+    "ismayilli": (40.7872, 48.1522),
+    "kalbajar": (40.1042, 46.0364),
+    "kangarli": (39.3981, 45.1139),
+    "kurdamir": (40.3453, 48.1608),
+    "gakh": (41.4225, 46.9247),
+    "gazakh": (41.0933, 45.3661),
+    "gabala": (40.9814, 47.8458),
+    "gobustan": (40.5333, 48.9333),
+    "guba": (41.3611, 48.5125),
+    "gubadli": (39.3439, 46.5797),
+    "qusar": (41.4275, 48.4303),
+    "lachin": (39.6383, 46.5461),
+    "lerik": (38.7739, 48.4150),
+    "masalli": (39.0342, 48.6656),
+    "neftchala": (39.3586, 49.2472),
+    "oguz": (41.0708, 47.4658),
+    "ordubad": (38.9047, 46.0231),
+    "saatli": (39.9322, 48.3689),
+    "sabirabad": (40.0053, 48.4719),
+    "salyan": (39.5961, 48.9847),
+    "samukh": (40.7642, 46.4083),
+    "sadarak": (39.7108, 44.8864),
+    "siyazan": (41.0783, 49.1119),
+    "shabran": (41.2158, 48.9864),
+    "shahbuz": (39.4072, 45.5739),
+    "shamakhi": (40.6314, 48.6414),
+    "shamkir": (40.8297, 46.0189),
+    "sharur": (39.5536, 44.9847),
+    "shusha": (39.7583, 46.7486),
+    "terter": (40.3419, 46.9306),
+    "tovuz": (40.9922, 45.6289),
+    "ucar": (40.5186, 47.6542),
+    "yardimli": (38.9058, 48.2400),
+    "zagatala": (41.6336, 46.6433),
+    "zangilan": (39.0856, 46.6525),
+    "zardab": (40.2183, 47.7083),
+}
+
+DISTRICT_COORDINATES = {
+    "binagadi": (40.4667, 49.8333),
+    "garadagh": (40.3200, 49.6300),
+    "khatai": (40.3833, 49.9500),
+    "khazar": (40.4700, 50.1000),
+    "narimanov": (40.4050, 49.8700),
+    "nasimi": (40.3800, 49.8300),
+    "nizami": (40.3900, 49.9300),
+    "pirallahi": (40.4600, 50.3200),
+    "sabail": (40.3500, 49.8300),
+    "sabunchu": (40.4400, 49.9500),
+    "surakhani": (40.4200, 50.0300),
+    "yasamal": (40.3800, 49.8100),
+}
@@ -76,4 +76,6 @@ def populate_cities():
 }
     for x, y in data.items():
         from core.models.city_model import City
-        cities = City.objects.create(name=x, display_name=y)
+        from core.coordinates import CITY_COORDINATES
+        latitude, longitude = CITY_COORDINATES.get(x, (None, None))
+        cities = City.objects.create(name=x, display_name=y, latitude=latitude, longitude=longitude)
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from reviews.models.review_img_model import ReviewWorkImage
+from users.models.work_image_model import WorkImage
+from utils.images import generate_renditions
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate resized and WebP renditions for work and review images '
+        'uploaded before renditions existed.'
+    )
+
+    def handle(self, *args, **options):
+        for model in (WorkImage, ReviewWorkImage):
+            images = model.objects.filter(renditions={}, temp_upload='').exclude(image='').exclude(image=None)
+            built = failed = 0
+            for image in images.iterator():
+                try:
+                    generate_renditions(image)
+                    built += 1
+                except Exception as error:
+                    failed += 1
+                    self.stderr.write(f'{model.__name__} #{image.pk}: {error}')
+            style = self.style.WARNING if failed else self.style.SUCCESS
+            self.stdout.write(style(f'{model.__name__}: {built} built, {failed} failed'))
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:29
+
+from django.db import migrations, models
+
+from core.coordinates import CITY_COORDINATES, DISTRICT_COORDINATES
+
+
+def populate_coordinates(apps, schema_editor):
+    City = apps.get_model('core', 'City')
+    District = apps.get_model('core', 'District')
+    for model, coordinates in ((City, CITY_COORDINATES), (District, DISTRICT_COORDINATES)):
+        for name, (latitude, longitude) in coordinates.items():
+            model.objects.filter(name=name).update(latitude=latitude, longitude=longitude)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='city',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='city',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='district',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='district',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.RunPython(populate_coordinates, migrations.RunPython.noop),
+    ]
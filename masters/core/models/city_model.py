@@ -9,6 +9,14 @@ class City(models.Model):
     display_name = models.CharField(
         max_length=60
         ) 
+    latitude = models.FloatField(
+        null=True,
+        blank=True
+        )
+    longitude = models.FloatField(
+        null=True,
+        blank=True
+        )
     
     class Meta:
         ordering = ['display_name']
@@ -33,6 +41,14 @@ class District(models.Model):
         max_length=60,
         unique=True
         )
+    latitude = models.FloatField(
+        null=True,
+        blank=True
+        )
+    longitude = models.FloatField(
+        null=True,
+        blank=True
+        )
     
     class Meta:
         ordering = ['display_name']
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+from utils.uploads import UPLOAD_KINDS
+
+
+class UploadSlotSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=UPLOAD_KINDS)
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
@@ -1,9 +1,13 @@
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 
 from core.models.city_model import City, District
 from core.models.language_model import Language
+from core.tasks import rebuild_reference_bootstrap
+from utils.cache_versions import invalidate_reference_data
+from utils.geo import invalidate_distance_table
 
 
 
@@ -11,12 +15,14 @@ from core.models.language_model import Language
 @receiver(post_delete, sender=City)
 def clear_city_caches(sender, **kwargs):
     cache.delete('city_list')
+    invalidate_reference_data('cities')
 
 
 @receiver(post_save, sender=District)
 @receiver(post_delete, sender=District)
 def clear_district_caches(sender, **kwargs):
     cache.delete('district_list')
+    invalidate_reference_data('districts')
 
 @receiver(post_save, sender=District)
 @receiver(post_delete, sender=District)
@@ -25,8 +31,27 @@ def clear_district_caches_for_city(sender, instance, **kwargs, ):
     cache.delete(f'district_list_for_city_{city_id}')
 
 
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+@receiver(post_save, sender=District)
+@receiver(post_delete, sender=District)
+def clear_distance_table(sender, **kwargs):
+    invalidate_distance_table()
+
+
 @receiver(post_save, sender=Language)
 @receiver(post_delete, sender=Language)
 def clear_language_caches(sender, **kwargs):
     cache.delete('language_list')
+    invalidate_reference_data('languages')
+
 
+@receiver(post_save, sender=City)
+@receiver(post_delete, sender=City)
+@receiver(post_save, sender=District)
+@receiver(post_delete, sender=District)
+@receiver(post_save, sender=Language)
+@receiver(post_delete, sender=Language)
+def schedule_bootstrap_rebuild(sender, **kwargs):
+    # Versiyalar artıq artırılıb, yeni blob arxa planda qurulur.
+    transaction.on_commit(rebuild_reference_bootstrap.delay)
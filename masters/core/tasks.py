@@ -0,0 +1,41 @@
+import logging
+
+from celery import shared_task
+
+from utils.bootstrap import rebuild_bootstrap_blob
+from utils.images import (
+    PERMANENT_IMAGE_ERRORS,
+    TRANSIENT_IMAGE_ERRORS,
+    discard_pending_image,
+    process_pending_image,
+    sweep_stale_uploads
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def rebuild_reference_bootstrap():
+    version, _ = rebuild_bootstrap_blob()
+    return version
+
+
+@shared_task(bind=True, max_retries=3)
+def process_uploaded_image(self, model_label, image_id, temp_name):
+    try:
+        return process_pending_image(model_label, image_id, temp_name)
+    except PERMANENT_IMAGE_ERRORS as exc:
+        logger.warning("Şəkil emal oluna bilmədi, silinir (%s #%s): %s", model_label, image_id, exc)
+        discard_pending_image(model_label, image_id, temp_name)
+    except TRANSIENT_IMAGE_ERRORS as exc:
+        if self.request.retries >= self.max_retries:
+            discard_pending_image(model_label, image_id, temp_name)
+            raise
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+@shared_task
+def sweep_stale_uploads_task():
+    # Tapşırığı itmiş və ya gözlənilməz xəta ilə dayanmış yükləmələri təmizləyir.
+    return sweep_stale_uploads()
@@ -65,6 +65,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party apps
     'rest_framework',
@@ -185,6 +186,53 @@ CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND')
 CELERY_IGNORE_RESULT = True
 CELERY_TIMEZONE = 'UTC'
+CELERY_BEAT_SCHEDULE = {
+    'rebuild-top-masters-leaderboard': {
+        'task': 'users.tasks.rebuild_top_masters_leaderboard',
+        'schedule': 30 * 60,
+    },
+    'reconcile-statistics': {
+        'task': 'services.tasks.reconcile_statistics_task',
+        'schedule': 60 * 60,
+    },
+    'recompute-ranking-scores': {
+        'task': 'reviews.tasks.recompute_ranking_scores_task',
+        'schedule': 60 * 60,
+    },
+    'rebuild-autocomplete-index': {
+        'task': 'services.tasks.rebuild_autocomplete_index_task',
+        'schedule': 24 * 60 * 60,
+    },
+    'sweep-stale-uploads': {
+        'task': 'core.tasks.sweep_stale_uploads_task',
+        'schedule': 60 * 60,
+    },
+}
+
+# Master ranking (utils/ranking.py)
+MASTER_RANKING = {
+    'PRIOR_WEIGHT': int(os.getenv('RANKING_PRIOR_WEIGHT', 10)),
+    'TAG_WEIGHT': float(os.getenv('RANKING_TAG_WEIGHT', 0.1)),
+    'TAG_HALF_LIFE_DAYS': int(os.getenv('RANKING_TAG_HALF_LIFE_DAYS', 180)),
+}
+
+# Proximity search (utils/geo.py): only masters within this radius are ranked by distance.
+PROXIMITY_RADIUS_KM = float(os.getenv('PROXIMITY_RADIUS_KM', 50))
+
+# Uploaded image processing, see utils/images.py
+IMAGE_PROCESSING = {
+    'TEMP_ROOT': os.getenv('IMAGE_UPLOAD_TEMP_ROOT', os.path.join(BASE_DIR, 'tmp_uploads')),
+    'MAX_SIZE': int(os.getenv('IMAGE_MAX_SIZE', 2048)),
+    'THUMBNAIL_SIZE': int(os.getenv('IMAGE_THUMBNAIL_SIZE', 400)),
+    'UPLOAD_WORKERS': int(os.getenv('IMAGE_UPLOAD_WORKERS', 4)),
+}
+
+# Presigned image uploads, see utils/uploads.py.
+# utils.uploads.LocalUploadBackend keeps files on local disk for development and tests.
+IMAGE_UPLOADS = {
+    'BACKEND': os.getenv('IMAGE_UPLOAD_BACKEND', 'utils.uploads.S3UploadBackend'),
+    'SLOT_TTL': int(os.getenv('IMAGE_UPLOAD_SLOT_TTL', 15 * 60)),
+}
 
 # Redis settings
 REDIS_HOST = os.getenv('REDIS_HOST', 'redis')         
@@ -205,6 +253,8 @@ AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 AWS_STORAGE_BUCKET_NAME = os.getenv('AWS_STORAGE_BUCKET_NAME')
 AWS_S3_REGION_NAME = os.getenv('AWS_S3_REGION_NAME')
+# S3-uyğun başqa xidmət (məs. MinIO) üçün.
+AWS_S3_ENDPOINT_URL = os.getenv('AWS_S3_ENDPOINT_URL')
 AWS_S3_CUSTOM_DOMAIN = f'{AWS_STORAGE_BUCKET_NAME}.s3.{AWS_S3_REGION_NAME}.amazonaws.com'
 AWS_S3_OBJECT_PARAMETERS = {'CacheControl': 'max-age=86400'}
 AWS_DEFAULT_ACL = None
@@ -267,6 +317,7 @@ CACHES = {
 }
 
 TIMEOUT = int(os.getenv('TIMEOUT', 3600))
+REFERENCE_DATA_MAX_AGE = int(os.getenv('REFERENCE_DATA_MAX_AGE', 3600))
 
 # Swagger settings
 SWAGGER_SETTINGS = {
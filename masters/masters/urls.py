@@ -24,6 +24,7 @@ urlpatterns = [
     path('api/v1/', include('apis.review_apis.urls', namespace='review_apis')),
     path('api/v1/', include('apis.user_apis.urls', namespace='user_apis')),
     path('api/v1/', include('apis.search_apis.urls', namespace='search_apis')),
+    path('api/v1/', include('apis.upload_apis.urls', namespace='upload_apis')),
 
     # Swagger & Redoc
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
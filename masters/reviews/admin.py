@@ -1,6 +1,7 @@
 from django.contrib import admin
 from reviews.models.review_models import Review
 from reviews.models.review_img_model import ReviewWorkImage
+from reviews.models.rating_model import MasterRating
 
 
 @admin.register(Review)
@@ -53,4 +54,11 @@ class ReviewWorkImageAdmin(admin.ModelAdmin):
     def image_preview(self, obj):
         return self.image_tag(obj)
     image_preview.allow_tags = True
-    image_preview.short_description = "Şəkil Önizləmə"
\ No newline at end of file
+    image_preview.short_description = "Şəkil Önizləmə"
+
+
+@admin.register(MasterRating)
+class MasterRatingAdmin(admin.ModelAdmin):
+    list_display = ('master', 'avg_rating', 'rating_count', 'updated_at')
+    search_fields = ('master__first_name', 'master__last_name', 'master__mobile_number')
+    readonly_fields = [field.name for field in MasterRating._meta.fields]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+# Miqrasiya yazıldığı andakı teqlər; tətbiq kodu dəyişsə də bu siyahı sabit qalır.
+TAG_FIELDS = (
+    'experienced', 'professional', 'patient', 'punctual', 'responsible',
+    'neat', 'time_management', 'communicative', 'efficient', 'agile',
+)
+
+
+def populate_master_ratings(apps, schema_editor):
+    CustomUser = apps.get_model('users', 'CustomUser')
+    Review = apps.get_model('reviews', 'Review')
+    MasterRating = apps.get_model('reviews', 'MasterRating')
+
+    aggregates = {
+        row.pop('master_id'): row
+        for row in Review.objects.values('master_id').annotate(
+            rating_sum=Sum('rating'),
+            rating_count=Count('id'),
+            **{f'{field}_count': Count('id', filter=Q(**{field: True})) for field in TAG_FIELDS}
+        ).order_by()
+    }
+    ratings = []
+    for master_id in CustomUser.objects.values_list('id', flat=True).iterator():
+        values = aggregates.get(master_id, {})
+        if values:
+            values['avg_rating'] = values['rating_sum'] / values['rating_count']
+        ratings.append(MasterRating(master_id=master_id, **values))
+    MasterRating.objects.bulk_create(ratings, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+        ('users', '0002_customuser_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MasterRating',
+            fields=[
+                ('master', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('avg_rating', models.FloatField(default=0)),
+                ('experienced_count', models.PositiveIntegerField(default=0)),
+                ('professional_count', models.PositiveIntegerField(default=0)),
+                ('patient_count', models.PositiveIntegerField(default=0)),
+                ('punctual_count', models.PositiveIntegerField(default=0)),
+                ('responsible_count', models.PositiveIntegerField(default=0)),
+                ('neat_count', models.PositiveIntegerField(default=0)),
+                ('time_management_count', models.PositiveIntegerField(default=0)),
+                ('communicative_count', models.PositiveIntegerField(default=0)),
+                ('efficient_count', models.PositiveIntegerField(default=0)),
+                ('agile_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_master_ratings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_masterrating'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='masterrating',
+            index=models.Index(fields=['-avg_rating', '-rating_count', '-master'], name='reviews_rating_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['master', '-created_at', '-id'], name='reviews_master_created_idx'),
+        ),
+    ]
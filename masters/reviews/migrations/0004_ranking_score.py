@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:30
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+PRIOR_WEIGHT = 10
+
+
+def populate_ranking_scores(apps, schema_editor):
+    # Teq bonusu ilk periodik hesablamada əlavə olunur, burada yalnız Bayes ortalaması.
+    MasterRating = apps.get_model('reviews', 'MasterRating')
+    totals = MasterRating.objects.aggregate(rating_sum=Sum('rating_sum'), rating_count=Sum('rating_count'))
+    prior_mean = totals['rating_sum'] / totals['rating_count'] if totals['rating_count'] else 0.0
+    MasterRating.objects.update(
+        ranking_score=(PRIOR_WEIGHT * prior_mean + F('rating_sum')) / (PRIOR_WEIGHT + F('rating_count'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='masterrating',
+            name='ranking_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='masterrating',
+            name='tag_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='masterrating',
+            index=models.Index(fields=['-ranking_score', '-master'], name='reviews_ranking_score_idx'),
+        ),
+        migrations.RunPython(populate_ranking_scores, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:35
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+
+TAG_FIELDS = (
+    'experienced', 'professional', 'patient', 'punctual', 'responsible',
+    'neat', 'time_management', 'communicative', 'efficient', 'agile',
+)
+
+
+def populate_tag_masks(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    mask = sum(
+        Case(When(**{field: True}, then=Value(1 << position)), default=Value(0))
+        for position, field in enumerate(TAG_FIELDS)
+    )
+    Review.objects.update(tag_mask=mask)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_ranking_score'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='tag_mask',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_tag_masks, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['master', 'tag_mask'], name='reviews_master_tag_mask_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_review_tag_mask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewworkimage',
+            name='temp_upload',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='reviewworkimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, null=True, upload_to='masters/reviews_images/thumbnails/'),
+        ),
+    ]
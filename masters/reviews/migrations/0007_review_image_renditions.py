@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_review_image_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewworkimage',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,3 @@
+from .review_models import Review
+from .review_img_model import ReviewWorkImage
+from .rating_model import MasterRating
@@ -0,0 +1,82 @@
+from django.db import models, transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from .review_models import Review, TAG_LABELS
+
+
+class MasterRating(models.Model):
+    """
+    Denormalized review aggregates of a single master.
+
+    Kept in sync from review signals so list and profile endpoints can read
+    the average rating, review count and tag counters without touching
+    the reviews table.
+    """
+    master = models.OneToOneField(
+        'users.CustomUser',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='rating_summary'
+        )
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    avg_rating = models.FloatField(default=0)
+    # Bayes ortalaması + son rəylərin teq bonusu, bax utils/ranking.py.
+    ranking_score = models.FloatField(default=0)
+    tag_score = models.FloatField(default=0)
+
+    experienced_count = models.PositiveIntegerField(default=0)
+    professional_count = models.PositiveIntegerField(default=0)
+    patient_count = models.PositiveIntegerField(default=0)
+    punctual_count = models.PositiveIntegerField(default=0)
+    responsible_count = models.PositiveIntegerField(default=0)
+    neat_count = models.PositiveIntegerField(default=0)
+    time_management_count = models.PositiveIntegerField(default=0)
+    communicative_count = models.PositiveIntegerField(default=0)
+    efficient_count = models.PositiveIntegerField(default=0)
+    agile_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-avg_rating', '-rating_count', '-master'], name='reviews_rating_rank_idx'),
+            models.Index(fields=['-ranking_score', '-master'], name='reviews_ranking_score_idx'),
+        ]
+
+    @staticmethod
+    def aggregate_reviews(reviews):
+        values = reviews.aggregate(
+            rating_sum=Coalesce(Sum('rating'), 0),
+            rating_count=Count('id'),
+            **{f'{field}_count': Count('id', filter=Q(**{field: True})) for field in TAG_LABELS}
+        )
+        values['avg_rating'] = values['rating_sum'] / values['rating_count'] if values['rating_count'] else 0
+        return values
+
+    @classmethod
+    def refresh_for(cls, master_id):
+        # utils.ranking bu moduldan import edir, dövri importa görə burada yüklənir.
+        from utils.ranking import score_for
+
+        with transaction.atomic():
+            # Sətri kilidləyirik ki, eyni ustaya paralel yazılan rəylər
+            # bir-birinin aqreqatını əzməsin.
+            tag_score = cls.objects.select_for_update().filter(
+                master_id=master_id
+            ).values_list('tag_score', flat=True).first()
+            locked = tag_score is not None
+            values = cls.aggregate_reviews(Review.objects.filter(master_id=master_id))
+            values['ranking_score'] = score_for(values['rating_sum'], values['rating_count'], tag_score or 0)
+            if locked:
+                cls.objects.filter(master_id=master_id).update(**values)
+            else:
+                cls.objects.create(master_id=master_id, **values)
+        return values
+
+    def given_tags(self):
+        return [label for field, label in TAG_LABELS.items() if getattr(self, f'{field}_count') > 0]
+
+    def __str__(self):
+        return f'Rating summary for {self.master_id}'
@@ -5,6 +5,11 @@ from .review_models import Review
 class ReviewWorkImage(models.Model):
     review = models.ForeignKey(Review, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(upload_to='masters/reviews_images/', blank=True, null=True)
+    thumbnail = models.ImageField(upload_to='masters/reviews_images/thumbnails/', blank=True, null=True)
+    # Emal gözləyən faylın müvəqqəti yaddaşdakı adı, emaldan sonra boşalır.
+    temp_upload = models.CharField(max_length=255, blank=True, editable=False)
+    # {format: {width: storage name}}, bax utils/images.py.
+    renditions = models.JSONField(default=dict, blank=True, editable=False)
     order = models.PositiveIntegerField(default=0) 
     uploaded_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
@@ -6,9 +6,30 @@ from django.core.validators import(
     MinLengthValidator
     )
 
+from reviews.review_managers import ReviewQuerySet
 from utils.validators import az_letters_validator, not_only_whitespace
 
 
+TAG_LABELS = {
+    'experienced': "Təcrübəli",
+    'professional': "Peşəkar",
+    'patient': "Səbirli",
+    'punctual': "Dəqiq",
+    'responsible': "Məsuliyyətli",
+    'neat': "Səliqəli",
+    'time_management': "Vaxta nəzarət",
+    'communicative': "Ünsiyyətcil",
+    'efficient': "Səmərəli",
+    'agile': "Çevik",
+}
+# Hər teqin tag_mask sütunundakı biti, TAG_LABELS sırası ilə.
+TAG_BITS = {field: 1 << position for position, field in enumerate(TAG_LABELS)}
+
+
+def tags_to_mask(fields):
+    return sum(TAG_BITS[field] for field in set(fields))
+
+
 class Review(models.Model):
     # user =  models.ForeignKey(       # real customer user will add in product level
     #     'users.CustomUser', 
@@ -49,26 +70,35 @@ class Review(models.Model):
     communicative = models.BooleanField(default=False, verbose_name="Ünsiyyətcil")
     efficient = models.BooleanField(default=False, verbose_name="Səmərəli")
     agile = models.BooleanField(default=False, verbose_name="Çevik")
+    # Yuxarıdakı teqlərin bitmaskası, save() zamanı yenilənir.
+    tag_mask = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    objects = ReviewQuerySet.as_manager()
 
     @property
     def tag_list(self):
-        tags = {
-            "Təcrübəli": self.experienced,
-            "Peşəkar": self.professional,
-            "Səbirli": self.patient,
-            "Dəqiq": self.punctual,
-            "Məsuliyyətli": self.responsible,
-            "Səliqəli": self.neat,
-            "Vaxta nəzarət": self.time_management,
-            "Ünsiyyətcil": self.communicative,
-            "Səmərəli": self.efficient,
-            "Çevik": self.agile,
-        }
-        return [name for name, value in tags.items() if value]
+        return [label for field, label in TAG_LABELS.items() if self.tag_mask & TAG_BITS[field]]
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    # class Meta:
-    #     unique_together = ('master', 'user')
+    class Meta:
+        # unique_together = ('master', 'user')
+        indexes = [
+            models.Index(fields=['master', '-created_at', '-id'], name='reviews_master_created_idx'),
+            models.Index(fields=['master', 'tag_mask'], name='reviews_master_tag_mask_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.tag_mask = tags_to_mask(field for field in TAG_BITS if getattr(self, field))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and TAG_BITS.keys() & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'tag_mask'}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
 
@@ -0,0 +1,36 @@
+from django.db import models
+from django.db.models import Count, F
+
+
+##########//  Review QuerySet  \\##########
+class ReviewQuerySet(models.QuerySet):
+    def for_listing(self):
+        """
+        Prefetches the images `ReviewSerializer` nests, so a page of reviews
+        costs two queries regardless of its size.
+        """
+        return self.prefetch_related('images')
+
+    def with_tags(self, mask):
+        """
+        Reviews carrying every tag of `mask` (see `tags_to_mask`).
+        """
+        if not mask:
+            return self
+        return self.alias(matched_tags=F('tag_mask').bitand(mask)).filter(matched_tags=mask)
+
+    def tag_histogram(self):
+        """
+        Number of reviews per tag. Reviews are grouped by their bitmask (at
+        most a few dozen distinct values per master, read from the
+        master/tag_mask index) and the groups are split into tags here.
+        """
+        from reviews.models.review_models import TAG_BITS
+
+        histogram = dict.fromkeys(TAG_BITS, 0)
+        groups = self.order_by().values('tag_mask').annotate(review_count=Count('id'))
+        for group in groups:
+            for field, bit in TAG_BITS.items():
+                if group['tag_mask'] & bit:
+                    histogram[field] += group['review_count']
+        return histogram
@@ -1,18 +1,27 @@
 from rest_framework import serializers
 from reviews.models.review_img_model import ReviewWorkImage
+from utils.images import build_srcset
 
 
 class ReviewImageSerializer(serializers.ModelSerializer):
     master = serializers.PrimaryKeyRelatedField(read_only=True)  
     image_url = serializers.SerializerMethodField()
+    thumbnail_url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model =  ReviewWorkImage
-        fields =  '__all__' 
+        exclude = ['temp_upload', 'renditions']
 
     def get_image_url(self, obj):
         if obj.image:
             return obj.image.url
         return None
-    
-    
+
+    def get_thumbnail_url(self, obj):
+        if obj.thumbnail:
+            return obj.thumbnail.url
+        return None
+
+    def get_srcset(self, obj):
+        return build_srcset(obj.renditions, obj.image.storage)
@@ -4,6 +4,7 @@ from django.core.validators import FileExtensionValidator
 
 from reviews.models.review_models import Review
 from reviews.models.review_img_model import ReviewWorkImage
+from utils.uploads import create_images, validate_uploads
 from .review_img_serializer import ReviewImageSerializer
 
 
@@ -19,12 +20,19 @@ class ReviewSerializer(serializers.ModelSerializer):
         allow_null=True,
         write_only=True
     )
+    review_image_uploads = serializers.ListField(
+        child=serializers.CharField(),
+        max_length=3,
+        required=False,
+        write_only=True
+    )
     master = serializers.PrimaryKeyRelatedField(read_only=True)
     images = ReviewImageSerializer(many=True, read_only=True)
     
     class Meta:
         model = Review
-        fields = '__all__'
+        # tag_mask daxili indeks sütunudur, teqlər ayrı-ayrı sahələrlə verilir.
+        exclude = ['tag_mask']
 
     def validate(self, data):
         logger.debug("Validating review data: %s", data)
@@ -70,6 +78,11 @@ class ReviewSerializer(serializers.ModelSerializer):
             logger.warning("Too many rating fields filled: %d", len(filled))
             raise serializers.ValidationError('Ən çox 5 sahəyə dəyər verə bilərsiniz.')
         
+        image_count = len(data.get('review_images') or []) + len(data.get('review_image_uploads') or [])
+        if image_count > 3:
+            logger.warning("Too many images uploaded: %d", image_count)
+            raise serializers.ValidationError('Maksimum 3 şəkil yükləyə bilərsiniz')
+
         logger.debug("Validation successful")
         return data
 
@@ -86,31 +99,34 @@ class ReviewSerializer(serializers.ModelSerializer):
 
         return value
 
+    def validate_review_image_uploads(self, value):
+        return validate_uploads(value, 'review')
+
     def update(self, instance, validated_data):
         review_images = validated_data.pop('review_images', None)
+        review_image_slots = validated_data.pop('review_image_uploads', None)
         logger.info("Updating review id=%s with data: %s", instance.id, validated_data)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
 
-        if review_images is not None:
+        if review_images is not None or review_image_slots is not None:
             logger.debug("Updating images for review id=%s", instance.id)
             instance.images.all().delete()
-            for idx, image in enumerate(review_images):
-                ReviewWorkImage.objects.create(review=instance, image=image, order=idx)
+            create_images(ReviewWorkImage, review_images or [], review_image_slots or [], review=instance)
 
         return instance
 
     def create(self, validated_data):
         master = self.context['master']
         review_images = validated_data.pop('review_images', [])
+        review_image_slots = validated_data.pop('review_image_uploads', [])
         logger.info("Creating review for master=%s with data: %s", master.id, validated_data)
 
         review = Review.objects.create(master=master, **validated_data)
 
-        for idx, image in enumerate(review_images):
-            ReviewWorkImage.objects.create(review=review, image=image, order=idx)
-            logger.debug("Image #%d created for review id=%s", idx, review.id)
+        images = create_images(ReviewWorkImage, review_images, review_image_slots, review=review)
+        logger.debug("%d images queued for processing, review id=%s", len(images), review.id)
 
         return review
\ No newline at end of file
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from reviews.models.review_models import Review
+from reviews.models.rating_model import MasterRating
+from users.models.user_model import CustomUser
+from utils.cache_versions import invalidate_category_masters
+from utils.leaderboard import refresh_master_score
+from utils.profiles import invalidate_profiles
+from utils.search_cache import invalidate_search_tags, master_search_tags
+from utils.statistics import increment_statistic
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def refresh_master_rating(sender, instance, origin=None, **kwargs):
+    # Usta silinəndə rəylər kaskadla silinir, aqreqatı yeniləməyə ehtiyac yoxdur.
+    if isinstance(origin, CustomUser):
+        return
+    master = instance.master
+    MasterRating.refresh_for(master.pk)
+    transaction.on_commit(lambda: refresh_master_score(master.pk))
+    transaction.on_commit(lambda: invalidate_category_masters(master.profession_area_id))
+    tags = master_search_tags(master)
+    transaction.on_commit(lambda: invalidate_search_tags(tags))
+    transaction.on_commit(lambda: invalidate_profiles(master.pk))
+
+
+@receiver(post_save, sender=CustomUser)
+def create_master_rating(sender, instance, created, **kwargs):
+    if created:
+        MasterRating.objects.get_or_create(master=instance)
+
+
+@receiver(post_save, sender=Review)
+def update_rating_counters(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_values', {})
+    if created:
+        increment_statistic('rating_sum', instance.rating)
+        increment_statistic('rating_count', 1)
+    elif 'rating' in loaded:
+        increment_statistic('rating_sum', instance.rating - loaded['rating'])
+    instance._loaded_values = {**loaded, 'rating': instance.rating}
+
+
+@receiver(post_delete, sender=Review)
+def decrement_rating_counters(sender, instance, **kwargs):
+    increment_statistic('rating_sum', -instance.rating)
+    increment_statistic('rating_count', -1)
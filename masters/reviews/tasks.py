@@ -0,0 +1,12 @@
+from celery import shared_task
+
+from utils.leaderboard import rebuild_leaderboard
+from utils.ranking import recompute_ranking_scores
+
+
+@shared_task
+def recompute_ranking_scores_task():
+    updated = recompute_ranking_scores()
+    # Yeni ballar reytinq cədvəlinə də yazılmalıdır.
+    rebuild_leaderboard()
+    return updated
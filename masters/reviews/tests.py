@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from reviews.models.review_models import TAG_BITS, TAG_LABELS, Review, tags_to_mask
+from reviews.serializers.review_serializers import ReviewSerializer
+from utils.ranking import add_decayed_tags, bayesian_average
+
+
+class ReviewTagMaskTests(SimpleTestCase):
+    """
+    The tag booleans are mirrored into `tag_mask` on save; the mask is an
+    internal column and never part of the review API.
+    """
+    def test_mask_has_one_bit_per_tag(self):
+        self.assertEqual(len(set(TAG_BITS.values())), len(TAG_LABELS))
+        self.assertEqual(tags_to_mask([]), 0)
+        self.assertEqual(tags_to_mask(['experienced', 'neat', 'neat']), TAG_BITS['experienced'] | TAG_BITS['neat'])
+
+    def test_save_keeps_mask_in_sync(self):
+        review = Review(rating=5, comment='Əla iş', professional=True, agile=True)
+        with mock.patch('django.db.models.Model.save') as model_save:
+            review.save()
+            self.assertEqual(review.tag_mask, TAG_BITS['professional'] | TAG_BITS['agile'])
+            self.assertEqual(review.tag_list, [TAG_LABELS['professional'], TAG_LABELS['agile']])
+
+            review.agile = False
+            review.save(update_fields=['agile'])
+            self.assertEqual(review.tag_mask, TAG_BITS['professional'])
+            self.assertEqual(model_save.call_args.kwargs['update_fields'], {'agile', 'tag_mask'})
+
+    def test_serializer_hides_tag_mask(self):
+        fields = ReviewSerializer().fields
+        self.assertNotIn('tag_mask', fields)
+        for tag in TAG_LABELS:
+            self.assertIn(tag, fields)
+
+
+class RankingScoreTests(SimpleTestCase):
+    def test_bayesian_average_prefers_many_good_reviews(self):
+        one_perfect = bayesian_average(5, 1, prior_mean=4.0, prior_weight=10)
+        many_good = bayesian_average(4.9 * 200, 200, prior_mean=4.0, prior_weight=10)
+        self.assertGreater(many_good, one_perfect)
+        self.assertEqual(bayesian_average(0, 0, prior_mean=4.0, prior_weight=10), 4.0)
+
+    def test_bayesian_average_is_vectorized(self):
+        scores = bayesian_average(np.array([5.0, 980.0]), np.array([1.0, 200.0]), 4.0, 10)
+        np.testing.assert_allclose(scores, [
+            bayesian_average(5, 1, 4.0, 10),
+            bayesian_average(980, 200, 4.0, 10),
+        ])
+
+    def test_tag_counts_decay_by_half_life(self):
+        now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        three_tags = TAG_BITS['neat'] | TAG_BITS['agile'] | TAG_BITS['patient']
+        rows = [
+            (10, now, three_tags),
+            (10, now - timedelta(days=180), TAG_BITS['neat'] | TAG_BITS['agile']),
+            (20, now - timedelta(days=360), TAG_BITS['neat']),
+            (99, now, three_tags),
+        ]
+        totals = add_decayed_tags(np.zeros(2), rows, {10: 0, 20: 1}, now, half_life_days=180)
+        np.testing.assert_allclose(totals, [3 + 2 * 0.5, 0.25])
+
+    def test_future_reviews_are_not_boosted(self):
+        now = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        totals = add_decayed_tags(np.zeros(1), [(1, now + timedelta(days=5), TAG_BITS['neat'])], {1: 0}, now, 180)
+        np.testing.assert_allclose(totals, [1.0])
@@ -1,21 +1,29 @@
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.cache import cache
 
 from .models.category_model import Category
 from .models.service_model import Service
+from core.tasks import rebuild_reference_bootstrap
+from utils.cache_versions import invalidate_reference_data
+from utils.autocomplete import index_entry, named_entry, remove_entry
+from utils.statistics import increment_statistic
 
 
 @receiver(post_save, sender=Category)
 @receiver(post_delete, sender=Category)
-def clear_category_caches(sender, **kwargs):
-    cache.delete('category_list')
+def clear_category_caches(sender, instance, **kwargs):
+    # Servis siyahıları kateqoriyanı da daxil edir.
+    cache.delete_many(['category_list', 'services_list', f'services_for_category_{instance.pk}'])
+    invalidate_reference_data('categories', 'services')
 
 
 @receiver(post_save, sender=Service)
 @receiver(post_delete, sender=Service)
 def clear_service_caches(sender, **kwargs):
     cache.delete('services_list')
+    invalidate_reference_data('services')
 
 
 @receiver(post_save, sender=Service)
@@ -23,4 +31,40 @@ def clear_service_caches(sender, **kwargs):
 def clear_service_caches_for_category(sender, instance, **kwargs):
     category_id = instance.category_id
     cache_key = f'services_for_category_{category_id}'
-    cache.delete(cache_key)
\ No newline at end of file
+    cache.delete(cache_key)
+
+
+@receiver(post_save, sender=Category)
+def increment_category_counter(sender, instance, created, **kwargs):
+    if created:
+        increment_statistic('category_count', 1)
+
+
+@receiver(post_delete, sender=Category)
+def decrement_category_counter(sender, instance, **kwargs):
+    increment_statistic('category_count', -1)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Service)
+def update_autocomplete_entry(sender, instance, **kwargs):
+    kind = 'categories' if sender is Category else 'services'
+    label, members = named_entry(instance)
+    transaction.on_commit(lambda: index_entry(kind, instance.pk, label, members))
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Service)
+def remove_autocomplete_entry(sender, instance, **kwargs):
+    kind = 'categories' if sender is Category else 'services'
+    obj_id = instance.pk
+    transaction.on_commit(lambda: remove_entry(kind, obj_id))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def schedule_bootstrap_rebuild(sender, **kwargs):
+    # Versiyalar artıq artırılıb, yeni blob arxa planda qurulur.
+    transaction.on_commit(rebuild_reference_bootstrap.delay)
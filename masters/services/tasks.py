@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from utils.autocomplete import rebuild_autocomplete_index
+from utils.statistics import reconcile_statistics
+
+
+@shared_task
+def reconcile_statistics_task():
+    # Siqnallardan yan keçən dəyişiklikləri (bulk update, birbaşa SQL) düzəldir.
+    return reconcile_statistics()
+
+
+@shared_task
+def rebuild_autocomplete_index_task():
+    rebuild_autocomplete_index()
@@ -0,0 +1,71 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from users.models.user_model import CustomUser
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the master listing queries and report which scans the planner '
+        'picks, to verify that the listing indexes are used.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            help='Run EXPLAIN ANALYZE and report the actual execution time.'
+        )
+        parser.add_argument(
+            '--without-seqscan',
+            action='store_true',
+            help='Disable sequential scans for the session. Useful on small '
+                 'databases where a seq scan is cheaper than any index.'
+        )
+
+    def benchmark_queries(self):
+        masters = CustomUser.objects.active_masters()
+        sample = masters.values('profession_area_id', 'profession_speciality_id').first() or {}
+        city_id = CustomUser.cities.through.objects.values_list('city_id', flat=True).first()
+        language_id = CustomUser.languages.through.objects.values_list('language_id', flat=True).first()
+
+        return {
+            'newest masters': masters.order_by('-created_at', '-id')[:10],
+            'category masters': masters.filter(
+                profession_area_id=sample.get('profession_area_id')
+            ).order_by('-created_at', '-id')[:10],
+            'service masters': masters.filter(
+                profession_speciality_id=sample.get('profession_speciality_id')
+            ).order_by('-created_at', '-id')[:10],
+            'by experience': masters.order_by('-experience_years', '-id')[:10],
+            'city filter': masters.filter(cities__id=city_id).order_by('-id')[:10],
+            'language filter': masters.filter(languages__id=language_id).order_by('-id')[:10],
+        }
+
+    def collect_scans(self, plan, scans):
+        node_type = plan.get('Node Type', '')
+        if node_type.endswith('Scan'):
+            target = plan.get('Index Name') or plan.get('Relation Name', '')
+            scans.append(f'{node_type} ({target})')
+        for child in plan.get('Plans', []):
+            self.collect_scans(child, scans)
+        return scans
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options['without_seqscan']:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for name, queryset in self.benchmark_queries().items():
+                plan = json.loads(queryset.explain(format='json', analyze=options['analyze']))
+                scans = self.collect_scans(plan['Plan'], [])
+                uses_seq_scan = any(scan.startswith('Seq Scan') for scan in scans)
+                style = self.style.WARNING if uses_seq_scan else self.style.SUCCESS
+
+                line = f'{name}: ' + ', '.join(scans)
+                if options['analyze']:
+                    line += f" — {plan['Execution Time']:.2f} ms"
+                self.stdout.write(style(line))
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:16
+
+import re
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+
+
+# utils/search.py-nin miqrasiya anındakı surəti, sonrakı dəyişikliklər bu
+# miqrasiyanın nəticəsini dəyişməsin.
+SEARCH_CONFIG = 'simple'
+AZ_FOLD_TABLE = str.maketrans({
+    'Ə': 'e', 'ə': 'e',
+    'I': 'i', 'ı': 'i', 'İ': 'i',
+    'Ş': 's', 'ş': 's',
+    'Ç': 'c', 'ç': 'c',
+    'Ğ': 'g', 'ğ': 'g',
+    'Ö': 'o', 'ö': 'o',
+    'Ü': 'u', 'ü': 'u',
+})
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def normalize_search_text(value):
+    if not value:
+        return ''
+    folded = str(value).translate(AZ_FOLD_TABLE).lower()
+    return ' '.join(TOKEN_RE.findall(folded))
+
+
+def build_search_text(user):
+    return normalize_search_text(' '.join(filter(None, [
+        user.first_name,
+        user.last_name,
+        user.custom_profession,
+        user.education_speciality,
+    ])))
+
+
+def build_search_vector(user):
+    full_name = normalize_search_text(f'{user.first_name} {user.last_name}')
+    return (
+        SearchVector(Value(full_name), weight='A', config=SEARCH_CONFIG)
+        + SearchVector(Value(normalize_search_text(user.custom_profession)), weight='B', config=SEARCH_CONFIG)
+        + SearchVector(Value(normalize_search_text(user.education_speciality)), weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def populate_search_documents(apps, schema_editor):
+    CustomUser = apps.get_model('users', 'CustomUser')
+    for user in CustomUser.objects.all().iterator():
+        CustomUser.objects.filter(pk=user.pk).update(
+            search_text=build_search_text(user),
+            search_document=build_search_vector(user),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0001_initial'),
+        ('services', '0001_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='customuser',
+            name='search_document',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_document'], name='users_search_document_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_text'], name='users_search_text_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+    ]
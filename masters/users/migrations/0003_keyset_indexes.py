@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0001_initial'),
+        ('services', '0001_initial'),
+        ('users', '0002_customuser_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_master', True)), fields=['-created_at', '-id'], name='users_master_created_idx'),
+        ),
+    ]
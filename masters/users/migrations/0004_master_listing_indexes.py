@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:26
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0001_initial'),
+        ('services', '0001_initial'),
+        ('users', '0003_keyset_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_master', True)), fields=['profession_area', '-created_at', '-id'], name='users_master_area_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_master', True)), fields=['profession_speciality', '-created_at', '-id'], name='users_master_speciality_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_master', True)), fields=['experience_years', 'id'], name='users_master_experience_idx'),
+        ),
+        # M2M through cədvəllərində yalnız (customuser_id, x_id) unikal indeksi var;
+        # şəhər/dil filtrindən ustaya keçid üçün tərs sıralı indeks lazımdır.
+        migrations.RunSQL(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS users_cities_city_master_idx '
+                'ON users_customuser_cities (city_id, customuser_id);',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS users_cities_city_master_idx;',
+        ),
+        migrations.RunSQL(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS users_languages_language_master_idx '
+                'ON users_customuser_languages (language_id, customuser_id);',
+            reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS users_languages_language_master_idx;',
+        ),
+    ]
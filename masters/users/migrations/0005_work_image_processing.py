@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_master_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workimage',
+            name='temp_upload',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='workimage',
+            name='thumbnail',
+            field=models.ImageField(blank=True, upload_to='work_images/thumbnails/', verbose_name='Kiçik şəkil'),
+        ),
+        migrations.AlterField(
+            model_name='workimage',
+            name='image',
+            field=models.ImageField(blank=True, upload_to='work_images/', verbose_name='İş şəkli'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_work_image_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workimage',
+            name='renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
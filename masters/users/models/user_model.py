@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils import timezone
-from django.db.models import Avg
+from django.core.exceptions import ObjectDoesNotExist
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
@@ -10,7 +12,6 @@ from ..user_managers import CustomUserManager
 
 from services.models.category_model import Category
 from services.models.service_model import Service
-from reviews.models.review_models import Review
 from core.models.city_model import City, District
 from core.models.language_model import Language
 from utils.validators import az_letters_validator
@@ -151,37 +152,81 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     created_at = models.DateTimeField(default=timezone.now, verbose_name="Yaradılma tarixi")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Son yenilənmə tarixi")
 
+    ##########//  Axtarış  \\##########
+    search_text = models.TextField(
+        blank=True,
+        default='',
+        editable=False
+    )
+
+    search_document = SearchVectorField(
+        null=True,
+        editable=False
+    )
+
     USERNAME_FIELD = 'mobile_number'
     REQUIRED_FIELDS = [] 
 
     objects = CustomUserManager()
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['search_document'], name='users_search_document_gin'),
+            GinIndex(fields=['search_text'], name='users_search_text_trgm', opclasses=['gin_trgm_ops']),
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(is_active=True, is_master=True),
+                name='users_master_created_idx'
+            ),
+            models.Index(
+                fields=['profession_area', '-created_at', '-id'],
+                condition=models.Q(is_active=True, is_master=True),
+                name='users_master_area_idx'
+            ),
+            models.Index(
+                fields=['profession_speciality', '-created_at', '-id'],
+                condition=models.Q(is_active=True, is_master=True),
+                name='users_master_speciality_idx'
+            ),
+            models.Index(
+                fields=['experience_years', 'id'],
+                condition=models.Q(is_active=True, is_master=True),
+                name='users_master_experience_idx'
+            ),
+        ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Statistika sayğacları üçün yüklənmiş vəziyyəti yadda saxlayırıq.
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_rating_summary(self):
+        try:
+            return self.rating_summary
+        except ObjectDoesNotExist:
+            return None
+
     def average_rating(self):
-        average = Review.objects.filter(master=self).aggregate(avg=Avg('rating'))['avg']
-        if average is None:
+        summary = self.get_rating_summary()
+        if summary is None or not summary.rating_count:
             return ''
-        return round(average, 2)
+        return round(summary.avg_rating, 2)
 
     @property
     def given_tags_with_count(self):
-        tags = {
-            "Təcrübəli": Review.objects.filter(master=self, experienced=True).count(),
-            "Peşəkar": Review.objects.filter(master=self, professional=True).count(),
-            "Səbirli": Review.objects.filter(master=self, patient=True).count(),
-            "Dəqiq": Review.objects.filter(master=self, punctual=True).count(),
-            "Məsuliyyətli": Review.objects.filter(master=self, responsible=True).count(),
-            "Səliqəli": Review.objects.filter(master=self, neat=True).count(),
-            "Vaxta nəzarət": Review.objects.filter(master=self, time_management=True).count(),
-            "Ünsiyyətcil": Review.objects.filter(master=self, communicative=True).count(),
-            "Səmərəli": Review.objects.filter(master=self, efficient=True).count(),
-            "Çevik": Review.objects.filter(master=self, agile=True).count(),
-        }
-    
-        return [name for name, count in tags.items() if count > 0]
+        summary = self.get_rating_summary()
+        if summary is None:
+            return []
+        return summary.given_tags()
 
     @property
     def review_count(self):
-        return Review.objects.filter(master=self).count()
+        summary = self.get_rating_summary()
+        if summary is None:
+            return 0
+        return summary.rating_count
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.mobile_number})"
\ No newline at end of file
@@ -2,8 +2,15 @@ from django.db import models
 
 
 class WorkImage(models.Model):
-    image = models.ImageField(upload_to='work_images/', verbose_name="İş şəkli")
+    image = models.ImageField(upload_to='work_images/', blank=True, verbose_name="İş şəkli")
+    thumbnail = models.ImageField(upload_to='work_images/thumbnails/', blank=True, verbose_name="Kiçik şəkil")
+    # Emal gözləyən faylın müvəqqəti yaddaşdakı adı, emaldan sonra boşalır.
+    temp_upload = models.CharField(max_length=255, blank=True, editable=False)
+    # {format: {width: storage name}}, bax utils/images.py.
+    renditions = models.JSONField(default=dict, blank=True, editable=False)
     order = models.PositiveIntegerField(default=0, verbose_name="Sıra")
 
     def __str__(self):
-        return f"İş Şəkli {self.image.url}"
\ No newline at end of file
+        if not self.image:
+            return f"İş Şəkli #{self.pk} (emal olunur)"
+        return f"İş Şəkli {self.image.url}"
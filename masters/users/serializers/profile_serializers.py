@@ -8,6 +8,7 @@ from core.models.city_model import City, District
 from core.models.language_model import Language
 from users.models import CustomUser
 from users.models import  WorkImage
+from utils.uploads import attach_upload, create_images, validate_uploads
 
 
 class ProfileSerializer(serializers.ModelSerializer):
@@ -96,6 +97,13 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
     languages = serializers.PrimaryKeyRelatedField(many=True, queryset=Language.objects.all(), required=False)
     profile_image = serializers.ImageField(required=False)
     work_images = serializers.ListField(child=serializers.ImageField(), required=False, write_only=True)
+    work_image_uploads = serializers.ListField(
+        child=serializers.CharField(),
+        max_length=10,
+        write_only=True,
+        required=False
+    )
+    profile_image_upload = serializers.CharField(write_only=True, required=False)
 
     new_password = serializers.CharField(write_only=True, required=False)
     new_password_two = serializers.CharField(write_only=True, required=False)
@@ -106,7 +114,8 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             "first_name", "last_name", "birth_date", "gender", "mobile_number",
             "profession_area", "profession_speciality", "custom_profession", "experience_years",'work_images',
             "new_password", "new_password_two", "cities",  "districts", "education", "education_speciality", "languages",
-            "profile_image", "facebook", "instagram", "tiktok", "linkedin", "note"
+            "profile_image", "facebook", "instagram", "tiktok", "linkedin", "note",
+            "work_image_uploads", "profile_image_upload"
         ]
 
     def validate_mobile_number(self, value):
@@ -215,6 +224,12 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
 
         return value
 
+    def validate_work_image_uploads(self, value):
+        return validate_uploads(value, 'work')
+
+    def validate_profile_image_upload(self, value):
+        return validate_uploads([value], 'profile')[0]
+
     def update(self, instance, validated_data):
         validated_data.pop('new_password_two', None)
 
@@ -222,6 +237,8 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
         districts = validated_data.pop("districts", None)
         languages = validated_data.pop("languages", None)
         work_images = validated_data.pop("work_images", None)
+        work_image_slots = validated_data.pop("work_image_uploads", [])
+        profile_image_slot = validated_data.pop("profile_image_upload", None)
         new_password = validated_data.pop('new_password', None) 
 
         for attr, value in validated_data.items():
@@ -242,10 +259,12 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             instance.set_password(new_password)
             instance.save()
 
-        if work_images is not None:
-            for image in work_images:
-                work_image = WorkImage.objects.create(image=image)
-                instance.work_images.add(work_image)
+        new_work_images = create_images(WorkImage, work_images or [], work_image_slots)
+        if new_work_images:
+            instance.work_images.add(*new_work_images)
+
+        if profile_image_slot:
+            attach_upload(instance.profile_image, profile_image_slot)
 
         instance.save()
         return instance
\ No newline at end of file
@@ -9,6 +9,7 @@ from services.models.service_model import Service
 
 from users.models import CustomUser
 from users.models import  WorkImage
+from utils.uploads import attach_upload, create_images, validate_uploads
 
 
 class CustomUserSerializer(serializers.ModelSerializer):
@@ -131,6 +132,13 @@ class RegisterSerializer(serializers.ModelSerializer):
         write_only=True,
         required=False
     )
+    work_image_uploads = serializers.ListField(
+        child=serializers.CharField(),
+        max_length=10,
+        write_only=True,
+        required=False
+    )
+    profile_image_upload = serializers.CharField(write_only=True, required=False)
     first_name = serializers.CharField(
         required=True,
         allow_blank=False,
@@ -318,6 +326,10 @@ class RegisterSerializer(serializers.ModelSerializer):
             # İş şəkilləri
             'work_images',
 
+            # Birbaşa yaddaşa yüklənmiş şəkillər (utils/uploads.py)
+            'work_image_uploads',
+            'profile_image_upload',
+
             # Əlavə qeyd
             'note',
         ]
@@ -504,6 +516,12 @@ class RegisterSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Əlavə qeyd ən çoxu 1500 simvol olmalıdır.")
         return value
 
+    def validate_work_image_uploads(self, value):
+        return validate_uploads(value, 'work')
+
+    def validate_profile_image_upload(self, value):
+        return validate_uploads([value], 'profile')[0]
+
     def validate(self, attrs):
         password = attrs.get('password')
         password2 = attrs.get('password2')
@@ -553,6 +571,8 @@ class RegisterSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         work_images_data = validated_data.pop('work_images', [])
+        work_image_slots = validated_data.pop('work_image_uploads', [])
+        profile_image_slot = validated_data.pop('profile_image_upload', None)
         password = validated_data.pop('password')
         validated_data.pop('password2')
 
@@ -580,6 +600,8 @@ class RegisterSerializer(serializers.ModelSerializer):
             custom_profession = custom_profession,
         )
         user.set_password(password)
+        if profile_image_slot:
+            attach_upload(user.profile_image, profile_image_slot)
         user.save()
 
         def extract_ids(qs):
@@ -595,9 +617,10 @@ class RegisterSerializer(serializers.ModelSerializer):
         
         user.languages.set(extract_ids(languages))
 
-        for image in work_images_data:
-            img = WorkImage.objects.create(image=image)
-            user.work_images.add(img)
+        # Bütün iş şəkilləri bir INSERT və bir M2M əlavəsi ilə yazılır.
+        work_images = create_images(WorkImage, work_images_data, work_image_slots)
+        if work_images:
+            user.work_images.add(*work_images)
 
         return user
 
@@ -1,11 +1,17 @@
 from rest_framework import serializers
 from users.models import  WorkImage
+from utils.images import build_srcset
 
 
 class WorkImageSerializer(serializers.ModelSerializer):
+    srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = WorkImage
-        fields = '__all__'
+        exclude = ['temp_upload', 'renditions']
         extra_kwargs = {
             'image': {'required': False}
-        }
\ No newline at end of file
+        }
+
+    def get_srcset(self, obj):
+        return build_srcset(obj.renditions, obj.image.storage)
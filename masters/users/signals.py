@@ -1,9 +1,194 @@
-from django.core.cache import cache
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
 from django.dispatch import receiver
 from users.models.user_model import CustomUser
+from users.models.work_image_model import WorkImage
+from utils.autocomplete import index_master, remove_entry
+from utils.cache_versions import invalidate_category_masters
+from utils.profiles import invalidate_profiles
+from utils.leaderboard import refresh_master_score, remove_master
+from utils.search_cache import invalidate_search_tags, master_search_tags, masters_search_tags
+from utils.statistics import increment_statistic
+from utils.search import build_search_text, build_search_vector
+
+
+SEARCH_SOURCE_FIELDS = {'first_name', 'last_name', 'custom_profession', 'education_speciality'}
+LEADERBOARD_SOURCE_FIELDS = {'is_active', 'is_master', 'last_login'}
+MASTER_CARD_IGNORED_FIELDS = {'last_login', 'password'}
+AUTOCOMPLETE_SOURCE_FIELDS = {'first_name', 'last_name', 'custom_profession', 'is_active', 'is_master'}
+# m2m əlaqəsi -> (sahə, axtarış teqinin prefiksi). Rayonlar üzrə filtr yoxdur,
+# amma kartlar və yaxınlıq sırası onlardan asılıdır.
+SEARCH_RELATIONS = {
+    CustomUser.cities.through: ('cities', 'city'),
+    CustomUser.languages.through: ('languages', 'language'),
+    CustomUser.districts.through: ('districts', None),
+}
+
+
+@receiver(post_save, sender=CustomUser)
+def update_search_document(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCH_SOURCE_FIELDS.intersection(update_fields):
+        return
+    CustomUser.objects.filter(pk=instance.pk).update(
+        search_text=build_search_text(instance),
+        search_document=build_search_vector(instance)
+    )
+
+
+@receiver(post_save, sender=CustomUser)
+def update_leaderboard_entry(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not LEADERBOARD_SOURCE_FIELDS.intersection(update_fields):
+        return
+    master_id = instance.pk
+    transaction.on_commit(lambda: refresh_master_score(master_id))
+
+
+@receiver(post_delete, sender=CustomUser)
+def remove_leaderboard_entry(sender, instance, **kwargs):
+    master_id = instance.pk
+    transaction.on_commit(lambda: remove_master(master_id))
+
+
+@receiver(post_save, sender=CustomUser)
+def update_master_counter(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_values', {})
+    is_active_master = instance.is_active and instance.is_master
+    if created:
+        was_active_master = False
+    elif 'is_active' in loaded and 'is_master' in loaded:
+        was_active_master = loaded['is_active'] and loaded['is_master']
+    else:
+        # Əvvəlki vəziyyət məlum deyil, sayğacı periodik tutuşdurma düzəldəcək.
+        was_active_master = is_active_master
+    increment_statistic('master_count', int(is_active_master) - int(was_active_master))
+
+
+@receiver(post_delete, sender=CustomUser)
+def decrement_master_counter(sender, instance, **kwargs):
+    if instance.is_active and instance.is_master:
+        increment_statistic('master_count', -1)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_category_pages(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= MASTER_CARD_IGNORED_FIELDS:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    # Usta kateqoriyasını dəyişibsə, həm köhnə, həm yeni siyahı köhnəlir.
+    category_ids = (loaded.get('profession_area_id'), instance.profession_area_id)
+    transaction.on_commit(lambda: invalidate_category_masters(*category_ids))
+
+
+@receiver(post_delete, sender=CustomUser)
+def invalidate_category_pages_on_delete(sender, instance, **kwargs):
+    category_id = instance.profession_area_id
+    transaction.on_commit(lambda: invalidate_category_masters(category_id))
+
+
+@receiver(m2m_changed, sender=CustomUser.cities.through)
+@receiver(m2m_changed, sender=CustomUser.districts.through)
+def invalidate_category_pages_on_locations(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        if not pk_set:
+            return
+        category_ids = list(
+            CustomUser.objects.filter(pk__in=pk_set).values_list('profession_area_id', flat=True).distinct()
+        )
+    else:
+        category_ids = [instance.profession_area_id]
+    transaction.on_commit(lambda: invalidate_category_masters(*category_ids))
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_search_cache(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= MASTER_CARD_IGNORED_FIELDS:
+        return
+    tags = master_search_tags(instance, getattr(instance, '_loaded_values', {}))
+    transaction.on_commit(lambda: invalidate_search_tags(tags))
+
+
+@receiver(pre_delete, sender=CustomUser)
+def invalidate_search_cache_on_delete(sender, instance, **kwargs):
+    # Şəhər və dil əlaqələri silinmədən əvvəl teqləri toplayırıq.
+    tags = master_search_tags(instance)
+    transaction.on_commit(lambda: invalidate_search_tags(tags))
+
+
+@receiver(m2m_changed, sender=CustomUser.cities.through)
+@receiver(m2m_changed, sender=CustomUser.languages.through)
+@receiver(m2m_changed, sender=CustomUser.districts.through)
+def invalidate_search_cache_on_relations(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ('pre_clear', 'post_add', 'post_remove'):
+        return
+    relation, prefix = SEARCH_RELATIONS[sender]
+    if reverse:
+        if pk_set is None:
+            # pre_clear: əlaqə hələ silinməyib, ustaları oradan tapırıq.
+            masters = CustomUser.objects.filter(**{relation: instance})
+        else:
+            masters = CustomUser.objects.filter(pk__in=pk_set)
+        tags = masters_search_tags(masters)
+        if prefix:
+            tags.add(f'{prefix}:{instance.pk}')
+    else:
+        tags = master_search_tags(instance)
+        if prefix:
+            tags.update(f'{prefix}:{pk}' for pk in pk_set or [])
+    transaction.on_commit(lambda: invalidate_search_tags(tags))
+
 
 @receiver(post_save, sender=CustomUser)
+def update_autocomplete_entry(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not AUTOCOMPLETE_SOURCE_FIELDS.intersection(update_fields):
+        return
+    master_id = instance.pk
+    transaction.on_commit(lambda: index_master(master_id))
+
+
 @receiver(post_delete, sender=CustomUser)
-def clear_cache(sender, **kwargs):
-    cache.delete_pattern('search_*') 
\ No newline at end of file
+def remove_autocomplete_entry(sender, instance, **kwargs):
+    master_id = instance.pk
+    transaction.on_commit(lambda: remove_entry('masters', master_id))
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_profile_cache(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) <= MASTER_CARD_IGNORED_FIELDS:
+        return
+    master_id = instance.pk
+    transaction.on_commit(lambda: invalidate_profiles(master_id))
+
+
+@receiver(m2m_changed, sender=CustomUser.languages.through)
+@receiver(m2m_changed, sender=CustomUser.cities.through)
+@receiver(m2m_changed, sender=CustomUser.districts.through)
+@receiver(m2m_changed, sender=CustomUser.work_images.through)
+def invalidate_profile_cache_on_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        master_ids = list(pk_set or [])
+    else:
+        master_ids = [instance.pk]
+    transaction.on_commit(lambda: invalidate_profiles(*master_ids))
+
+
+@receiver(post_save, sender=WorkImage)
+@receiver(pre_delete, sender=WorkImage)
+def invalidate_profile_cache_on_work_image(sender, instance, **kwargs):
+    master_ids = list(instance.customuser_set.values_list('id', flat=True))
+    transaction.on_commit(lambda: invalidate_profiles(*master_ids))
+
+
+@receiver(post_save, sender=CustomUser)
+def remember_saved_values(sender, instance, **kwargs):
+    # Sonuncu receiver olmalıdır: yuxarıdakılar köhnə dəyərləri oxuyur.
+    deferred = instance.get_deferred_fields()
+    instance._loaded_values = {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.attname not in deferred
+    }
@@ -1,5 +1,6 @@
 from celery import shared_task
 
+from utils.leaderboard import rebuild_leaderboard
 from utils.otp import create_otp
 
 
@@ -8,4 +9,10 @@ def send_otp_task(phone_number):
     #In next progress we need to buy sms service for real otp code system
     #This is only for test
     code = create_otp(phone_number)
-    return f'Telefon nömrəsi {phone_number} üçün OTP: {code}'
\ No newline at end of file
+    return f'Telefon nömrəsi {phone_number} üçün OTP: {code}'
+
+
+@shared_task
+def rebuild_top_masters_leaderboard():
+    # Artımlı yeniləmələrdən qaçan dəyişiklikləri (məs. queryset.update) düzəldir.
+    rebuild_leaderboard()
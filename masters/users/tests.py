@@ -1,3 +1,184 @@
-from django.test import TestCase
+import base64
+import json
+from datetime import date, datetime, timezone
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from core.models.city_model import City, District
+from reviews.models.review_models import Review
+from services.models.category_model import Category
+from services.models.service_model import Service
+from apis.search_apis.search_views import SearchAPIView
+from users.models.user_model import CustomUser
+from utils.paginations import CustomPagination, MasterCursorPagination, TopRatedCursorPagination
+from utils.search_cache import UNMATCHABLE_SEARCH, canonical_search_params, search_tags
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MasterCardQueryCountTests(TestCase):
+    """
+    Every master list endpoint must serialize a page with a fixed number of
+    queries, no matter how many masters the page holds. Response caches
+    are local and the top list is read from the database, so no earlier
+    run's cache or leaderboard keys (and no Celery broker) are involved.
+    """
+    MAX_QUERIES = 6
+    MASTER_COUNT = 12
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='repair', display_name='Təmir')
+        cls.service = Service.objects.create(category=cls.category, name='plumber', display_name='Santexnik')
+        city = City.objects.create(name='baku', display_name='Bakı')
+        district = District.objects.create(city=city, name='yasamal', display_name='Yasamal')
+
+        for index in range(cls.MASTER_COUNT):
+            master = CustomUser.objects.create_user(
+                mobile_number=f'50{index:07d}',
+                password='Test1234!',
+                first_name='Əli',
+                last_name='Məmmədov',
+                birth_date=date(1990, 1, 1),
+                gender='MALE',
+                experience_years=5,
+                education='0',
+                profession_area=cls.category,
+                profession_speciality=cls.service,
+            )
+            master.cities.add(city)
+            master.districts.add(district)
+            Review.objects.create(master=master, rating=5, comment='Əla iş', professional=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        for target in ('utils.leaderboard.is_leaderboard_built', 'utils.leaderboard.schedule_leaderboard_rebuild'):
+            patcher = mock.patch(target, return_value=False)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def endpoints(self):
+        return [
+            '/api/v1/professionals/',
+            '/api/v1/professionals/top/',
+            f'/api/v1/service/{self.service.id}/professionals/',
+            f'/api/v1/category/{self.category.id}/professionals/',
+            '/api/v1/professionals/search/?search=Əli',
+        ]
+
+    def count_queries(self, url, page_size):
+        separator = '&' if '?' in url else '?'
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(f'{url}{separator}page_size={page_size}')
+        self.assertEqual(response.status_code, 200, url)
+        self.assertEqual(len(response.data['results']), page_size, url)
+        return len(context.captured_queries)
+
+    def test_master_pages_use_constant_number_of_queries(self):
+        for url in self.endpoints():
+            with self.subTest(url=url):
+                small_page = self.count_queries(url, page_size=2)
+                large_page = self.count_queries(url, page_size=self.MASTER_COUNT)
+                self.assertLessEqual(large_page, self.MAX_QUERIES)
+                self.assertLessEqual(large_page, small_page)
+
+
+class KeysetCursorTests(SimpleTestCase):
+    """
+    Cursors come from the client, so anything that does not decode to
+    values of the ordering fields must be a 404, never a 500.
+    """
+    def request(self, position):
+        cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+        return Request(APIRequestFactory().get('/', {'cursor': cursor}))
+
+    def test_valid_cursor_is_converted_to_field_values(self):
+        created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        pagination = MasterCursorPagination()
+        position = pagination.decode_cursor(self.request([created_at.isoformat(), '7']), CustomUser)
+        self.assertEqual(position, [created_at, 7])
+
+    def test_annotated_ordering_field_is_resolved(self):
+        last_login = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        pagination = TopRatedCursorPagination()
+        position = pagination.decode_cursor(self.request(['4.5', 12, last_login.isoformat(), 3]), CustomUser)
+        self.assertEqual(position, [4.5, 12, last_login, 3])
+        with self.assertRaises(NotFound):
+            pagination.decode_cursor(self.request([None, 12, last_login.isoformat(), 3]), CustomUser)
+
+    def test_next_cursor_of_master_without_rating_summary_or_login(self):
+        # Annotasiyalar sıfır verir; rating_summary-yə müraciət edilmir.
+        master = CustomUser(id=5)
+        master.top_ranking_score, master.top_rating_count = 0.0, 0
+        master.top_last_login = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        pagination = TopRatedCursorPagination()
+        position = [pagination.get_value(master, field.lstrip('-')) for field in pagination.ordering]
+        cursor = pagination.encode_cursor(position)
+        request = Request(APIRequestFactory().get('/', {'cursor': cursor}))
+        self.assertEqual(pagination.decode_cursor(request, CustomUser), position)
+
+    def test_tampered_cursor_is_not_found(self):
+        pagination = MasterCursorPagination()
+        for position in (['x', 1], [None, 1], [{}, 1], ['2025-01-02T03:04:05+00:00', 'x'], [1], {'a': 1}):
+            with self.subTest(position=position):
+                with self.assertRaises(NotFound):
+                    pagination.decode_cursor(self.request(position), CustomUser)
+
+    def test_undecodable_cursor_is_not_found(self):
+        request = Request(APIRequestFactory().get('/', {'cursor': '%%%'}))
+        with self.assertRaises(NotFound):
+            MasterCursorPagination().decode_cursor(request, CustomUser)
+
+
+class PunctuationSearchTests(SimpleTestCase):
+    """
+    A term that folds to nothing matches no master, and the search ordering
+    must still resolve `search_rank` on that empty queryset.
+    """
+    def test_punctuation_only_search_returns_no_masters(self):
+        for term in ('!!!', '-', ' '):
+            with self.subTest(term=term):
+                view = SearchAPIView()
+                view.request = Request(APIRequestFactory().get('/', {'search': term}))
+                self.assertEqual(list(view.get_queryset()), [])
+
+
+class SearchCacheKeyTests(SimpleTestCase):
+    """
+    Query strings the view treats the same must share one cache entry, and
+    ones it treats differently must not.
+    """
+    def params(self, query_string):
+        return canonical_search_params(QueryDict(query_string), CustomPagination())
+
+    def test_equivalent_queries_share_params(self):
+        self.assertEqual(
+            self.params('search=Məmmədov&city_id=2,1&page=1&page_size=10&foo=bar'),
+            self.params('city_id=1&city_id=2&search=memmedov')
+        )
+        self.assertEqual(self.params('search=Məmmədov&city_id=2,1'), {'search': 'memmedov', 'city_id': [1, 2]})
+
+    def test_defaults_and_invalid_values_are_normalized(self):
+        self.assertEqual(self.params('ordering=name&page_size=500&experience_min=x'), {'page_size': 100})
+        self.assertEqual(self.params('profession_area_id=abc'), {'profession_area_id': 'abc'})
+
+    def test_search_changes_default_ordering(self):
+        self.assertEqual(self.params('search=ali&ordering=-id'), {'search': 'ali', 'ordering': '-id'})
+
+    def test_punctuation_only_search_is_not_the_unfiltered_listing(self):
+        for term in ('!!!', '-', ' '):
+            with self.subTest(term=term):
+                self.assertEqual(self.params(f'search={term}'), {'search': UNMATCHABLE_SEARCH})
+        self.assertEqual(self.params('search='), {})
+
+    def test_tags_follow_filters(self):
+        self.assertEqual(search_tags(self.params('city_id=1,2&profession_area_id=3')), ['area:3', 'city:1', 'city:2'])
+        self.assertEqual(search_tags(self.params('search=ali')), ['all'])
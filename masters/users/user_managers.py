@@ -1,10 +1,47 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
 from django.utils import timezone
 
 
 
+##########//  Custom User QuerySet  \\##########
+class CustomUserQuerySet(models.QuerySet):
+    def active_masters(self):
+        return self.filter(is_active=True, is_master=True)
+
+    def for_master_card(self):
+        """
+        Loads everything `CustomUserSerializer` touches so that a page of
+        masters costs a fixed number of queries regardless of its size.
+        """
+        return self.select_related(
+            'rating_summary',
+            'profession_area',
+            'profession_speciality__category',
+        ).prefetch_related(
+            'cities',
+            'districts',
+        )
+
+    def for_profile(self):
+        """
+        Loads everything `ProfileSerializer` touches: the rating summary with
+        its stored tag counters is joined, the M2M lists are prefetched.
+        """
+        return self.select_related(
+            'rating_summary',
+            'profession_area',
+            'profession_speciality__category',
+        ).prefetch_related(
+            'languages',
+            'cities',
+            'districts',
+            'work_images',
+        )
+
+
 ##########//  Custom User Manager  \\##########
-class CustomUserManager(BaseUserManager):
+class CustomUserManager(BaseUserManager.from_queryset(CustomUserQuerySet)):
     def create_user(self, mobile_number, password=None, **extra_fields):
         if not mobile_number:
             raise ValueError("Mobil nömrə mütləqdir.")
@@ -0,0 +1,196 @@
+import json
+
+from django.conf import settings
+from redis.exceptions import WatchError
+
+from services.models.category_model import Category
+from services.models.service_model import Service
+from users.models.user_model import CustomUser
+from utils.search import normalize_search_text
+
+
+AUTOCOMPLETE_KINDS = ('masters', 'services', 'categories')
+AUTOCOMPLETE_ENTRIES_KEY = 'autocomplete:entries'
+# Yalnız tam yenidənqurma yazır (dəyəri indekslənən obyekt sayıdır). Artımlı
+# yazılar bu açar olmadan heç nə etmir, ona görə Redis təmizlənəndən sonra bir
+# girişlik natamam indeks "qurulmuş" sayılmır.
+AUTOCOMPLETE_BUILT_KEY = 'autocomplete:built'
+AUTOCOMPLETE_REBUILD_LOCK_KEY = 'autocomplete:rebuild_lock'
+REBUILD_LOCK_TIMEOUT = 10 * 60
+AUTOCOMPLETE_MAX_LIMIT = 10
+# Leksik diapazonun yuxarı sərhədi: istənilən prefiksin davamından böyükdür.
+LEX_UPPER_BOUND = '\uffff'
+MEMBER_SEPARATOR = '\x00'
+
+
+def _index_key(kind):
+    return f'autocomplete:{kind}'
+
+
+def _entry_field(kind, obj_id):
+    return f'{kind}:{obj_id}'
+
+
+def build_members(obj_id, *texts):
+    """
+    One sorted-set member per word suffix of the folded text, so "Əli
+    Məmmədov" is found by both "ali" and "memm".
+    """
+    members = set()
+    for text in texts:
+        words = normalize_search_text(text).split()
+        for index in range(len(words)):
+            members.add(f"{' '.join(words[index:])}{MEMBER_SEPARATOR}{obj_id}")
+    return sorted(members)
+
+
+def master_entry(master):
+    name = f'{master.first_name} {master.last_name}'
+    return name, build_members(master.pk, name, master.custom_profession)
+
+
+def named_entry(obj):
+    return obj.display_name, build_members(obj.pk, obj.display_name)
+
+
+def index_entry(kind, obj_id, label, members):
+    """
+    Updates one entry of a fully built index. Before the first rebuild (or
+    after a flush) it does nothing; the rebuild will pick the object up.
+    """
+    field = _entry_field(kind, obj_id)
+    with settings.REDIS_CLIENT.pipeline() as pipe:
+        try:
+            # Yoxlama ilə yazı arasında yenidənqurma başlasa, yazı ləğv olunur.
+            pipe.watch(AUTOCOMPLETE_BUILT_KEY)
+            if not pipe.exists(AUTOCOMPLETE_BUILT_KEY):
+                return
+            previous = pipe.hget(AUTOCOMPLETE_ENTRIES_KEY, field)
+            pipe.multi()
+            if previous:
+                old_members = json.loads(previous)['members']
+                if old_members:
+                    pipe.zrem(_index_key(kind), *old_members)
+            if members:
+                pipe.zadd(_index_key(kind), {member: 0 for member in members})
+            pipe.hset(AUTOCOMPLETE_ENTRIES_KEY, field, json.dumps({'label': label, 'members': members}))
+            pipe.execute()
+        except WatchError:
+            pass
+
+
+def remove_entry(kind, obj_id):
+    client = settings.REDIS_CLIENT
+    field = _entry_field(kind, obj_id)
+    previous = client.hget(AUTOCOMPLETE_ENTRIES_KEY, field)
+    if not previous:
+        return
+    pipe = client.pipeline()
+    old_members = json.loads(previous)['members']
+    if old_members:
+        pipe.zrem(_index_key(kind), *old_members)
+    pipe.hdel(AUTOCOMPLETE_ENTRIES_KEY, field)
+    pipe.execute()
+
+
+def index_master(master_id):
+    master = CustomUser.objects.filter(pk=master_id).only(
+        'id', 'first_name', 'last_name', 'custom_profession', 'is_active', 'is_master'
+    ).first()
+    if master is None or not (master.is_active and master.is_master):
+        remove_entry('masters', master_id)
+        return
+    index_entry('masters', master.pk, *master_entry(master))
+
+
+def rebuild_autocomplete_index():
+    client = settings.REDIS_CLIENT
+    sources = {
+        'masters': (CustomUser.objects.active_masters().only(
+            'id', 'first_name', 'last_name', 'custom_profession'
+        ), master_entry),
+        'services': (Service.objects.only('id', 'display_name'), named_entry),
+        'categories': (Category.objects.only('id', 'display_name'), named_entry),
+    }
+    # Pipeline MULTI/EXEC ilə icra olunur, oxuyanlar yarımçıq indeks görmür.
+    pipe = client.pipeline()
+    pipe.delete(AUTOCOMPLETE_ENTRIES_KEY, *[_index_key(kind) for kind in AUTOCOMPLETE_KINDS])
+    indexed = 0
+    for kind, (queryset, build_entry) in sources.items():
+        for obj in queryset.iterator():
+            label, members = build_entry(obj)
+            if members:
+                pipe.zadd(_index_key(kind), {member: 0 for member in members})
+            pipe.hset(AUTOCOMPLETE_ENTRIES_KEY, _entry_field(kind, obj.pk), json.dumps({'label': label, 'members': members}))
+            indexed += 1
+    pipe.set(AUTOCOMPLETE_BUILT_KEY, indexed)
+    pipe.delete(AUTOCOMPLETE_REBUILD_LOCK_KEY)
+    pipe.execute()
+
+
+def schedule_autocomplete_rebuild():
+    """
+    Queues one rebuild task no matter how many requests find the index
+    missing; the lock is released by the rebuild or expires if the worker
+    dies.
+    """
+    # services.tasks bu moduldan import edir, dövri importa görə burada yüklənir.
+    from services.tasks import rebuild_autocomplete_index_task
+
+    if settings.REDIS_CLIENT.set(AUTOCOMPLETE_REBUILD_LOCK_KEY, 1, nx=True, ex=REBUILD_LOCK_TIMEOUT):
+        rebuild_autocomplete_index_task.delay()
+
+
+def autocomplete(term, limit=5):
+    """
+    Prefix lookup over the three lexicographic indexes: one ZRANGEBYLEX per
+    kind and one HMGET for the labels, no database access.
+    """
+    prefix = normalize_search_text(term)
+    if not prefix:
+        return empty_suggestions()
+
+    client = settings.REDIS_CLIENT
+    pipe = client.pipeline()
+    for kind in AUTOCOMPLETE_KINDS:
+        # Eyni obyekt bir neçə sözlə uyğun gələ bilər, ehtiyatla çox oxuyuruq.
+        pipe.zrangebylex(_index_key(kind), f'[{prefix}', f'[{prefix}{LEX_UPPER_BOUND}', start=0, num=limit * 4)
+
+    matches = {}
+    for kind, members in zip(AUTOCOMPLETE_KINDS, pipe.execute()):
+        ids = []
+        for member in members:
+            obj_id = int(member.rsplit(MEMBER_SEPARATOR, 1)[1])
+            if obj_id not in ids:
+                ids.append(obj_id)
+        matches[kind] = ids[:limit]
+
+    fields = [_entry_field(kind, obj_id) for kind, ids in matches.items() for obj_id in ids]
+    labels = dict(zip(fields, client.hmget(AUTOCOMPLETE_ENTRIES_KEY, fields))) if fields else {}
+
+    results = {}
+    for kind, ids in matches.items():
+        results[kind] = []
+        for obj_id in ids:
+            entry = labels.get(_entry_field(kind, obj_id))
+            if entry:
+                results[kind].append({'id': obj_id, 'name': json.loads(entry)['label']})
+    return results
+
+
+def empty_suggestions():
+    return {kind: [] for kind in AUTOCOMPLETE_KINDS}
+
+
+def is_autocomplete_index_built():
+    """
+    Built means a full rebuild ran and its entries are still there, unless
+    that rebuild had nothing to index.
+    """
+    pipe = settings.REDIS_CLIENT.pipeline()
+    pipe.get(AUTOCOMPLETE_BUILT_KEY)
+    pipe.exists(AUTOCOMPLETE_ENTRIES_KEY)
+    built_size, exists = pipe.execute()
+    if built_size is None:
+        return False
+    return bool(exists) or int(built_size) == 0
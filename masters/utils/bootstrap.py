@@ -0,0 +1,67 @@
+import gzip
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from core.models.city_model import City, District
+from core.models.language_model import Language
+from core.serializers.city_serializers import CitySerializer, DistrictSerializer
+from core.serializers.language_serializer import LanguageSerializer
+from services.models.category_model import Category
+from services.models.service_model import Service
+from services.serializers.category_serializer import CategorySerializer
+from services.serializers.service_serializer import ServiceSerializer
+from utils.cache_versions import get_cache_versions, reference_data_namespace
+
+
+BOOTSTRAP_SECTIONS = ('categories', 'services', 'cities', 'districts', 'languages')
+
+
+def bootstrap_version():
+    """
+    The blob depends on every reference list, so its version is the
+    combination of their version counters.
+    """
+    namespaces = [reference_data_namespace(name) for name in BOOTSTRAP_SECTIONS]
+    versions = get_cache_versions(namespaces)
+    return '.'.join(str(versions[namespace]) for namespace in namespaces)
+
+
+def _bootstrap_key(version):
+    return f'reference_bootstrap_v{version}'
+
+
+def build_bootstrap_blob(version):
+    data = {
+        'version': version,
+        'categories': CategorySerializer(Category.objects.all(), many=True).data,
+        'services': ServiceSerializer(Service.objects.select_related('category'), many=True).data,
+        'cities': CitySerializer(City.objects.all(), many=True).data,
+        'districts': DistrictSerializer(District.objects.all(), many=True).data,
+        'languages': LanguageSerializer(Language.objects.all(), many=True).data,
+    }
+    # mtime=0: eyni məlumat üçün baytlar da eyni qalır.
+    return gzip.compress(JSONRenderer().render(data), compresslevel=9, mtime=0)
+
+
+def _store_bootstrap_blob(version):
+    blob = build_bootstrap_blob(version)
+    cache.set(_bootstrap_key(version), blob, timeout=settings.TIMEOUT)
+    return blob
+
+
+def rebuild_bootstrap_blob():
+    version = bootstrap_version()
+    return version, _store_bootstrap_blob(version)
+
+
+def get_bootstrap_blob():
+    """
+    Returns (version, gzip-compressed JSON bytes) of all reference data.
+    """
+    version = bootstrap_version()
+    blob = cache.get(_bootstrap_key(version))
+    if blob is None:
+        blob = _store_bootstrap_blob(version)
+    return version, blob
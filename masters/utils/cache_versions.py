@@ -0,0 +1,70 @@
+import time
+
+from django.core.cache import cache
+
+
+def _version_key(namespace):
+    return f'cache_version:{namespace}'
+
+
+def _initial_version():
+    # Versiya açarı silinsə (eviction, flush), 1-dən başlamaq köhnə versiyanın
+    # keşlənmiş girişlərini yenidən oxunar edərdi; vaxt damğası təkrarlanmır.
+    return time.time_ns()
+
+
+def _seed_version(key):
+    version = _initial_version()
+    if cache.add(key, version, timeout=None):
+        return version
+    # Paralel sorğu artıq yazıb.
+    return cache.get(key, version)
+
+
+def get_cache_version(namespace):
+    key = _version_key(namespace)
+    version = cache.get(key)
+    return version if version is not None else _seed_version(key)
+
+
+def get_cache_versions(namespaces):
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(keys)
+    return {
+        namespace: found[key] if key in found else _seed_version(key)
+        for key, namespace in keys.items()
+    }
+
+
+def bump_cache_version(namespace):
+    """
+    Moves a namespace to a new version instead of deleting keys, so stale
+    entries are simply never read again and expire on their own. Missing
+    versions start from a timestamp, never from a value used before.
+    """
+    key = _version_key(namespace)
+    if not cache.add(key, _initial_version(), timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # add ilə incr arasında açar silinib.
+            cache.add(key, _initial_version(), timeout=None)
+
+
+def category_masters_namespace(category_id):
+    return f'category_masters_{category_id}'
+
+
+def invalidate_category_masters(*category_ids):
+    for category_id in set(category_ids):
+        if category_id is not None:
+            bump_cache_version(category_masters_namespace(category_id))
+
+
+def reference_data_namespace(name):
+    return f'reference_data_{name}'
+
+
+def invalidate_reference_data(*names):
+    for name in set(names):
+        bump_cache_version(reference_data_namespace(name))
@@ -0,0 +1,74 @@
+import hashlib
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from utils.cache_versions import get_cache_version, reference_data_namespace
+
+
+def make_etag(data):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, ensure_ascii=False)
+    return f'"{hashlib.sha1(payload.encode()).hexdigest()}"'
+
+
+def build_cache_entry(data, last_modified=None):
+    """
+    What the response caches store: the serialized data together with its
+    validators, so a conditional request is answered from one cache read.
+    `last_modified` is a datetime.
+    """
+    return {
+        'data': data,
+        'etag': make_etag(data),
+        'last_modified': int(last_modified.timestamp()) if last_modified else None,
+    }
+
+
+def conditional_response(request, entry, **cache_control):
+    """
+    Returns 304 when `If-None-Match` / `If-Modified-Since` match the cached
+    entry, otherwise a normal 200 response. Both carry ETag, Last-Modified
+    and the given Cache-Control directives.
+    """
+    response = Response(entry['data'], status=status.HTTP_200_OK)
+    response['ETag'] = entry['etag']
+    if entry.get('last_modified'):
+        response['Last-Modified'] = http_date(entry['last_modified'])
+    if cache_control:
+        patch_cache_control(response, **cache_control)
+    return get_conditional_response(
+        request,
+        etag=entry['etag'],
+        last_modified=entry.get('last_modified'),
+        response=response
+    )
+
+
+def reference_data(name):
+    """
+    Decorator for the GET handlers of reference lists (cities, languages,
+    categories, ...). The ETag is the list's version counter, so a matching
+    `If-None-Match` gets a 304 after a single cache read, before the view
+    runs. Successful responses are marked cacheable by clients and CDNs.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            version = get_cache_version(reference_data_namespace(name))
+            etag = f'"{name}-v{version}"'
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+            response['ETag'] = etag
+            patch_cache_control(response, public=True, max_age=settings.REFERENCE_DATA_MAX_AGE)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,138 @@
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, Exists, FloatField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Least
+
+from core.models.city_model import City, District
+from users.models.user_model import CustomUser
+from utils.cache_versions import bump_cache_version, get_cache_version
+
+
+EARTH_RADIUS_KM = 6371.0
+GEO_NAMESPACE = 'geo_locations'
+DISTANCE_TABLE_TIMEOUT = 60 * 60 * 24
+
+
+def haversine_matrix(origins, targets):
+    """
+    Great-circle distances in km between every row of `origins` and every
+    row of `targets`, both (n, 2) arrays of latitude/longitude in degrees.
+    """
+    origins = np.radians(origins)
+    targets = np.radians(targets)
+    lat1, lon1 = origins[:, 0][:, None], origins[:, 1][:, None]
+    lat2, lon2 = targets[:, 0][None, :], targets[:, 1][None, :]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def build_distance_table():
+    cities = {
+        city.id: (city.latitude, city.longitude)
+        for city in City.objects.exclude(latitude=None).exclude(longitude=None).only('id', 'latitude', 'longitude')
+    }
+    locations = [(f'city:{city_id}', coordinates) for city_id, coordinates in cities.items()]
+    for district in District.objects.only('id', 'city_id', 'latitude', 'longitude'):
+        if district.latitude is not None and district.longitude is not None:
+            locations.append((f'district:{district.id}', (district.latitude, district.longitude)))
+        elif district.city_id in cities:
+            # Koordinatı olmayan rayon öz şəhərinin mərkəzi ilə hesablanır.
+            locations.append((f'district:{district.id}', cities[district.city_id]))
+
+    if not locations:
+        return {'index': {}, 'matrix': np.zeros((0, 0), dtype=np.float32)}
+    coordinates = np.array([location[1] for location in locations], dtype=np.float64)
+    return {
+        'index': {key: position for position, (key, _) in enumerate(locations)},
+        'matrix': haversine_matrix(coordinates, coordinates).astype(np.float32),
+    }
+
+
+def get_distance_table():
+    cache_key = f'geo_distance_table_v{get_cache_version(GEO_NAMESPACE)}'
+    table = cache.get(cache_key)
+    if table is None:
+        table = build_distance_table()
+        cache.set(cache_key, table, timeout=DISTANCE_TABLE_TIMEOUT)
+    return table
+
+
+def invalidate_distance_table():
+    bump_cache_version(GEO_NAMESPACE)
+
+
+def distances_from(kind, obj_id, radius_km=None):
+    """
+    Returns {'city': {id: km}, 'district': {id: km}} for the given origin,
+    limited to `radius_km` when given, or None when the origin has no
+    coordinates.
+    """
+    table = get_distance_table()
+    position = table['index'].get(f'{kind}:{obj_id}')
+    if position is None:
+        return None
+    row = table['matrix'][position]
+    distances = {'city': {}, 'district': {}}
+    for key, index in table['index'].items():
+        if radius_km is not None and row[index] > radius_km:
+            continue
+        target_kind, target_id = key.split(':')
+        distances[target_kind][int(target_id)] = round(float(row[index]), 1)
+    return distances
+
+
+def _linked_locations(through, field, distances):
+    return through.objects.filter(customuser_id=OuterRef('pk'), **{f'{field}__in': list(distances)})
+
+
+def _nearest_distance(through, field, distances):
+    if not distances:
+        return Value(None, output_field=FloatField())
+    distance = Case(
+        *[When(**{field: location_id}, then=Value(km)) for location_id, km in distances.items()],
+        output_field=FloatField()
+    )
+    return Subquery(
+        _linked_locations(through, field, distances).annotate(
+            distance=distance
+        ).order_by('distance').values('distance')[:1],
+        output_field=FloatField()
+    )
+
+
+def nearby_distances(kind, obj_id):
+    """
+    `distances_from` limited to `PROXIMITY_RADIUS_KM`: the locations a
+    proximity search keeps, or None when the origin has no coordinates.
+    """
+    return distances_from(kind, obj_id, settings.PROXIMITY_RADIUS_KM)
+
+
+def filter_nearby(queryset, distances):
+    """
+    Keeps the masters linked to one of the `distances` districts or cities
+    with an indexed EXISTS, before anything is computed per row.
+    """
+    nearby = Q()
+    for through, field, location_kind in (
+        (CustomUser.districts.through, 'district_id', 'district'),
+        (CustomUser.cities.through, 'city_id', 'city'),
+    ):
+        if distances[location_kind]:
+            nearby |= Exists(_linked_locations(through, field, distances[location_kind]))
+    if not nearby:
+        return queryset.none()
+    return queryset.filter(nearby)
+
+
+def annotate_distance(queryset, distances):
+    """
+    Annotates `distance_km`: the distance to the closest of the master's
+    districts and cities among `distances`. The lookup table comes from
+    cache, so the database only evaluates a CASE over the nearby locations.
+    """
+    return queryset.annotate(distance_km=Least(
+        _nearest_distance(CustomUser.districts.through, 'district_id', distances['district']),
+        _nearest_distance(CustomUser.cities.through, 'city_id', distances['city']),
+    ))
@@ -0,0 +1,352 @@
+import mimetypes
+import multiprocessing
+import os
+import posixpath
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from io import BytesIO
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+
+DEFAULT_IMAGE_PROCESSING = {
+    # Web və celery konteynerləri eyni qovluğu görməlidir.
+    'TEMP_ROOT': os.path.join(settings.BASE_DIR, 'tmp_uploads'),
+    'MAX_SIZE': 2048,
+    'THUMBNAIL_SIZE': 400,
+    'JPEG_QUALITY': 85,
+    'RENDITION_WIDTHS': (320, 640, 1024),
+    'RENDITION_QUALITY': 80,
+    'RENDITION_WORKERS': 3,
+    # Bir şəklin bütün fayllarını (orijinal, kiçik şəkil, renditionlar) paralel yazan axınlar.
+    'UPLOAD_WORKERS': 4,
+    # Bundan köhnə emal olunmamış yükləmələri dövri təmizləmə silir (saniyə).
+    'STALE_AFTER': 24 * 60 * 60,
+}
+# Pillow-un saxlaya bildiyi əlavə formatlar; AVIF yalnız libavif ilə qurulmuş Pillow-da var.
+MODERN_FORMATS = {'webp': 'WEBP', 'avif': 'AVIF'}
+SOURCE_FORMATS = {'jpg': 'JPEG', 'png': 'PNG'}
+# Birbaşa media yaddaşına yüklənmiş (presigned) faylların temp_upload prefiksi.
+STORAGE_SOURCE_PREFIX = 'storage:'
+PENDING_IMAGE_MODELS = ('users.WorkImage', 'reviews.ReviewWorkImage')
+# Təkrar cəhd bunları düzəltmir: fayl şəkil deyil, zədəlidir və ya artıq yoxdur.
+# UnidentifiedImageError və FileNotFoundError da OSError-dur, ona görə əvvəl yoxlanılır.
+PERMANENT_IMAGE_ERRORS = (UnidentifiedImageError, Image.DecompressionBombError, FileNotFoundError, SyntaxError, ValueError)
+# Disk və yaddaş (S3) xətaları keçici sayılır.
+TRANSIENT_IMAGE_ERRORS = (OSError, BotoCoreError, ClientError)
+
+
+def get_image_config():
+    return {**DEFAULT_IMAGE_PROCESSING, **getattr(settings, 'IMAGE_PROCESSING', {})}
+
+
+def temp_storage():
+    return FileSystemStorage(location=get_image_config()['TEMP_ROOT'])
+
+
+def stage_upload(uploaded_file):
+    """
+    Writes the upload to local temp storage and returns its name there.
+    Large uploads Django already spooled to disk are moved, not copied.
+    """
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    return temp_storage().save(f'{uuid.uuid4().hex}{extension}', uploaded_file)
+
+
+def queue_images(model, temp_names, **fields):
+    """
+    Creates the image rows with one INSERT, without touching the media
+    storage. Each file is re-encoded and uploaded by a Celery task once the
+    transaction commits. `order` in `fields` is the first image's position.
+    """
+    # core.tasks bu moduldan import edir, dövri importa görə burada yüklənir.
+    from core.tasks import process_uploaded_image
+
+    if not temp_names:
+        return []
+    start = fields.pop('order', 0)
+    images = model.objects.bulk_create([
+        model(temp_upload=temp_name, order=start + position, **fields)
+        for position, temp_name in enumerate(temp_names)
+    ])
+    model_label = model._meta.label
+    jobs = [(image.pk, image.temp_upload) for image in images]
+
+    def schedule():
+        for image_id, temp_name in jobs:
+            process_uploaded_image.delay(model_label, image_id, temp_name)
+    transaction.on_commit(schedule)
+    return images
+
+
+def source_storage(temp_name):
+    """
+    (storage, name) the pending file is read from: the local temp storage,
+    or the media storage for files the client uploaded there directly.
+    """
+    if temp_name.startswith(STORAGE_SOURCE_PREFIX):
+        return default_storage, temp_name[len(STORAGE_SOURCE_PREFIX):]
+    return temp_storage(), temp_name
+
+
+def _has_alpha(image):
+    return image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+
+
+def encode_image(image, size, config):
+    """
+    Downscales `image` to fit `size` and re-encodes it. Nothing from the
+    original file's metadata (EXIF, GPS, comments) is written back.
+    Returns (bytes, extension).
+    """
+    image = image.copy()
+    image.thumbnail((size, size), Image.LANCZOS)
+    buffer = BytesIO()
+    if _has_alpha(image):
+        image.convert('RGBA').save(buffer, 'PNG', optimize=True)
+        return buffer.getvalue(), 'png'
+    image.convert('RGB').save(buffer, 'JPEG', quality=config['JPEG_QUALITY'], optimize=True, progressive=True)
+    return buffer.getvalue(), 'jpg'
+
+
+def rendition_formats(source_extension):
+    Image.init()
+    modern = [extension for extension, image_format in MODERN_FORMATS.items() if image_format in Image.SAVE]
+    return [*modern, source_extension]
+
+
+def render_width(source_data, width, formats, quality):
+    """
+    One rendition width in every format. Runs in a worker process, so it
+    takes and returns plain bytes.
+    """
+    with Image.open(BytesIO(source_data)) as source:
+        source.load()
+        image = source.copy()
+    image.thumbnail((width, image.height), Image.LANCZOS)
+    variants = {}
+    for extension in formats:
+        buffer = BytesIO()
+        image_format = MODERN_FORMATS.get(extension) or SOURCE_FORMATS[extension]
+        if image_format == 'JPEG':
+            image.convert('RGB').save(buffer, image_format, quality=quality, optimize=True, progressive=True)
+        elif image_format == 'PNG':
+            image.save(buffer, image_format, optimize=True)
+        else:
+            image.save(buffer, image_format, quality=quality)
+        variants[extension] = buffer.getvalue()
+    return width, variants
+
+
+def rendition_executor(max_workers):
+    # Celery prefork işçiləri daemon prosesdir və uşaq proses yarada bilmir.
+    if multiprocessing.current_process().daemon:
+        return ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        return ProcessPoolExecutor(max_workers=max_workers)
+    except (OSError, NotImplementedError):
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def render_renditions(source_data, source_width, source_extension, config):
+    """
+    Returns {extension: {width: bytes}} for every configured width that does
+    not upscale the source.
+    """
+    widths = [width for width in config['RENDITION_WIDTHS'] if width < source_width] or [source_width]
+    formats = rendition_formats(source_extension)
+    renditions = {extension: {} for extension in formats}
+    with rendition_executor(min(config['RENDITION_WORKERS'], len(widths))) as executor:
+        jobs = [
+            executor.submit(render_width, source_data, width, formats, config['RENDITION_QUALITY'])
+            for width in widths
+        ]
+        for job in jobs:
+            width, variants = job.result()
+            for extension, data in variants.items():
+                renditions[extension][width] = data
+    return renditions
+
+
+def rendition_files(field_file, base_name, source_data, source_width, source_extension, config):
+    """
+    Returns ({storage name: bytes}, renditions) where `renditions` is the
+    {extension: {width: name}} mapping kept on the model.
+    """
+    directory = os.path.join(field_file.field.upload_to, 'renditions')
+    files, renditions = {}, {}
+    for extension, widths in render_renditions(source_data, source_width, source_extension, config).items():
+        renditions[extension] = {}
+        for width, data in widths.items():
+            name = os.path.join(directory, f'{base_name}_{width}.{extension}')
+            files[name] = data
+            renditions[extension][str(width)] = name
+    return files, renditions
+
+
+def _s3_writer(storage):
+    # boto3 klienti thread-safe-dir, bütün axınlar eyni klientdən istifadə edir.
+    client = storage.bucket.meta.client
+
+    def write(name, data):
+        key = posixpath.join(storage.location, name) if storage.location else name
+        client.put_object(
+            Bucket=storage.bucket_name,
+            Key=key,
+            Body=data,
+            ContentType=mimetypes.guess_type(name)[0] or 'application/octet-stream',
+            **storage.get_object_parameters(name)
+        )
+        return name
+    return write
+
+
+def write_files(storage, files, max_workers):
+    """
+    Writes {name: bytes} to `storage` with at most `max_workers` uploads in
+    flight, so an image with all its renditions costs about one round trip.
+    Names are expected to be unique (they carry a uuid). On S3 the objects
+    are PUT through one shared boto3 client instead of a storage resource
+    per thread. If any write fails, the files that did get written are
+    deleted before the error is raised, so a retry leaves no orphans.
+    """
+    if hasattr(storage, 'bucket'):
+        write = _s3_writer(storage)
+    else:
+        def write(name, data):
+            return storage.save(name, ContentFile(data))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        jobs = [executor.submit(write, name, data) for name, data in files.items()]
+    written = [job.result() for job in jobs if job.exception() is None]
+    errors = [job.exception() for job in jobs if job.exception() is not None]
+    if errors:
+        for name in written:
+            storage.delete(name)
+        raise errors[0]
+    return written
+
+
+def build_srcset(renditions, storage):
+    """
+    `renditions` as `srcset` strings per format, e.g.
+    {'webp': 'https://.../a_320.webp 320w, https://.../a_640.webp 640w'}.
+    """
+    return {
+        extension: ', '.join(
+            f'{storage.url(name)} {width}w'
+            for width, name in sorted(widths.items(), key=lambda item: int(item[0]))
+        )
+        for extension, widths in (renditions or {}).items()
+    }
+
+
+def process_pending_image(model_label, image_id, temp_name):
+    storage, source_name = source_storage(temp_name)
+    obj = apps.get_model(model_label).objects.filter(pk=image_id).first()
+    if obj is None or obj.temp_upload != temp_name:
+        # Şəkil emal olunmamış silinib və ya yenisi ilə əvəz olunub.
+        storage.delete(source_name)
+        return None
+
+    config = get_image_config()
+    with storage.open(source_name, 'rb') as source_file, Image.open(source_file) as source:
+        # EXIF silinəcək, ona görə oriyentasiyanı əvvəlcədən piksellərə tətbiq edirik.
+        source = ImageOps.exif_transpose(source)
+        image_data, extension = encode_image(source, config['MAX_SIZE'], config)
+        thumbnail_data, thumbnail_extension = encode_image(source, config['THUMBNAIL_SIZE'], config)
+
+    image_width = Image.open(BytesIO(image_data)).width
+    base_name = uuid.uuid4().hex
+    image_name = obj.image.field.generate_filename(obj, f'{base_name}.{extension}')
+    thumbnail_name = obj.thumbnail.field.generate_filename(obj, f'{base_name}.{thumbnail_extension}')
+    files, renditions = rendition_files(obj.image, base_name, image_data, image_width, extension, config)
+    written = {image_name: image_data, thumbnail_name: thumbnail_data, **files}
+    write_files(obj.image.storage, written, config['UPLOAD_WORKERS'])
+
+    obj.image.name = image_name
+    obj.thumbnail.name = thumbnail_name
+    obj.renditions = renditions
+    obj.temp_upload = ''
+    try:
+        obj.save(update_fields=['image', 'thumbnail', 'renditions', 'temp_upload'])
+    except DatabaseError:
+        # Emal zamanı sətir silinib: yazılan fayllar heç yerə bağlı deyil.
+        for name in written:
+            obj.image.storage.delete(name)
+        storage.delete(source_name)
+        return None
+    storage.delete(source_name)
+    return obj.image.name
+
+
+def discard_pending_image(model_label, image_id, temp_name):
+    """
+    Gives up on an upload that cannot be processed: the row would otherwise
+    show an empty image for good, so it is deleted with its source file.
+    """
+    apps.get_model(model_label).objects.filter(pk=image_id, temp_upload=temp_name).delete()
+    storage, source_name = source_storage(temp_name)
+    storage.delete(source_name)
+
+
+def _is_stale(storage, name, cutoff):
+    return not storage.exists(name) or storage.get_modified_time(name) < cutoff
+
+
+def _walk(storage, directory=''):
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield os.path.join(directory, name)
+    for subdirectory in directories:
+        yield from _walk(storage, os.path.join(directory, subdirectory))
+
+
+def sweep_stale_uploads():
+    """
+    Periodic clean-up of uploads the pipeline never finished: rows whose
+    task was lost or crashed, and temp files staged by a request whose
+    transaction rolled back. Anything newer than STALE_AFTER may still be in
+    flight and is left alone. Returns the number of discarded rows.
+    """
+    cutoff = timezone.now() - timedelta(seconds=get_image_config()['STALE_AFTER'])
+    pending, discarded = set(), 0
+    for model_label in PENDING_IMAGE_MODELS:
+        rows = apps.get_model(model_label).objects.exclude(temp_upload='').values_list('pk', 'temp_upload')
+        for image_id, temp_name in rows.iterator():
+            if _is_stale(*source_storage(temp_name), cutoff):
+                discard_pending_image(model_label, image_id, temp_name)
+                discarded += 1
+            else:
+                pending.add(temp_name)
+
+    storage = temp_storage()
+    if os.path.isdir(storage.location):
+        for name in list(_walk(storage)):
+            if name not in pending and storage.get_modified_time(name) < cutoff:
+                storage.delete(name)
+    return discarded
+
+
+def generate_renditions(obj):
+    """
+    Builds renditions for an image stored before renditions existed. The
+    original is read back from the media storage and cleaned the same way
+    new uploads are before it is resized.
+    """
+    config = get_image_config()
+    with obj.image.open('rb') as image_file, Image.open(image_file) as source:
+        source_data, extension = encode_image(ImageOps.exif_transpose(source), config['MAX_SIZE'], config)
+    source_width = Image.open(BytesIO(source_data)).width
+    base_name = os.path.splitext(os.path.basename(obj.image.name))[0]
+    files, obj.renditions = rendition_files(obj.image, base_name, source_data, source_width, extension, config)
+    write_files(obj.image.storage, files, config['UPLOAD_WORKERS'])
+    obj.save(update_fields=['renditions'])
+    return obj.renditions
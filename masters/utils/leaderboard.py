@@ -0,0 +1,159 @@
+from django.conf import settings
+
+from users.models.user_model import CustomUser
+from utils.paginations import TOP_RATED_ANNOTATIONS, TOP_RATED_ORDERING
+
+
+LEADERBOARD_KEY = 'leaderboard:top_masters'
+# Yalnız tam yenidənqurma yazır (dəyəri qurulan üzv sayıdır). Artımlı yeniləmələr
+# bu açar olmadan sorted set yaratmır, ona görə Redis təmizlənəndən sonra bir
+# ustalıq natamam cədvəl "qurulmuş" sayılmır.
+LEADERBOARD_BUILT_KEY = f'{LEADERBOARD_KEY}:built'
+LEADERBOARD_REBUILD_LOCK_KEY = f'{LEADERBOARD_KEY}:rebuild_lock'
+REBUILD_LOCK_TIMEOUT = 10 * 60
+REBUILD_BATCH_SIZE = 1000
+
+
+def leaderboard_score(ranking_score, rating_count, last_login=None):
+    """
+    Packs the (ranking_score, rating_count, last_login) ordering into one
+    sortable float: thousandths of the ranking score first, then the review
+    count, then last_login as a sub-unit (coarse, about a day) tie-breaker.
+    """
+    score = round(ranking_score * 1000) * 10 ** 7 + min(rating_count, 10 ** 7 - 1)
+    if last_login:
+        score += last_login.timestamp() / 10 ** 10
+    return score
+
+
+def _score_for(master):
+    summary = master.get_rating_summary()
+    if summary is None:
+        return leaderboard_score(0, 0, master.last_login)
+    return leaderboard_score(summary.ranking_score, summary.rating_count, master.last_login)
+
+
+# ZADD yalnız cədvəl tam qurulubsa; yoxlama və yazı Redis-də atomik icra olunur.
+ZADD_IF_BUILT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('ZADD', KEYS[2], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+
+def refresh_master_score(master_id):
+    master = CustomUser.objects.select_related('rating_summary').filter(pk=master_id).first()
+    if master is None or not (master.is_active and master.is_master):
+        settings.REDIS_CLIENT.zrem(LEADERBOARD_KEY, master_id)
+        return
+    settings.REDIS_CLIENT.eval(
+        ZADD_IF_BUILT_SCRIPT, 2, LEADERBOARD_BUILT_KEY, LEADERBOARD_KEY, _score_for(master), master_id
+    )
+
+
+def remove_master(master_id):
+    settings.REDIS_CLIENT.zrem(LEADERBOARD_KEY, master_id)
+
+
+def rebuild_leaderboard():
+    """
+    Recomputes the whole leaderboard into a temporary key and swaps it in
+    atomically, so readers never see a half-built set.
+    """
+    client = settings.REDIS_CLIENT
+    building_key = f'{LEADERBOARD_KEY}:building'
+    client.delete(building_key)
+
+    masters = CustomUser.objects.active_masters().select_related('rating_summary').only(
+        'id', 'last_login', 'rating_summary__ranking_score', 'rating_summary__rating_count'
+    )
+    batch = {}
+    for master in masters.iterator(chunk_size=REBUILD_BATCH_SIZE):
+        batch[master.id] = _score_for(master)
+        if len(batch) >= REBUILD_BATCH_SIZE:
+            client.zadd(building_key, batch)
+            batch = {}
+    if batch:
+        client.zadd(building_key, batch)
+
+    size = client.zcard(building_key)
+    pipe = client.pipeline()
+    if size:
+        pipe.rename(building_key, LEADERBOARD_KEY)
+    else:
+        pipe.delete(LEADERBOARD_KEY)
+    pipe.set(LEADERBOARD_BUILT_KEY, size)
+    pipe.delete(LEADERBOARD_REBUILD_LOCK_KEY)
+    pipe.execute()
+
+
+def is_leaderboard_built():
+    """
+    Built means a full rebuild ran and its set is still there: a marker
+    whose set has vanished (eviction, or the last member removed) counts as
+    missing unless the rebuild itself found no masters.
+    """
+    pipe = settings.REDIS_CLIENT.pipeline()
+    pipe.get(LEADERBOARD_BUILT_KEY)
+    pipe.exists(LEADERBOARD_KEY)
+    built_size, exists = pipe.execute()
+    if built_size is None:
+        return False
+    return bool(exists) or int(built_size) == 0
+
+
+def schedule_leaderboard_rebuild():
+    """
+    Queues one rebuild task no matter how many requests find the
+    leaderboard missing; the lock is released when the rebuild finishes
+    or expires if the worker dies.
+    """
+    # users.tasks bu moduldan import edir, dövri importa görə burada yüklənir.
+    from users.tasks import rebuild_top_masters_leaderboard
+
+    if settings.REDIS_CLIENT.set(LEADERBOARD_REBUILD_LOCK_KEY, 1, nx=True, ex=REBUILD_LOCK_TIMEOUT):
+        rebuild_top_masters_leaderboard.delay()
+
+
+class TopMastersLeaderboard:
+    """
+    Sequence view over the leaderboard sorted set that Django's paginator
+    can slice: a page costs one ZREVRANGE and one primary key lookup.
+    """
+
+    def __init__(self, queryset=None):
+        self.queryset = queryset if queryset is not None else CustomUser.objects.active_masters().for_master_card()
+
+    def count(self):
+        return settings.REDIS_CLIENT.zcard(LEADERBOARD_KEY)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start = index.start or 0
+        if index.stop is None:
+            stop = -1
+        elif index.stop <= start:
+            return []
+        else:
+            stop = index.stop - 1
+        ids = [int(master_id) for master_id in settings.REDIS_CLIENT.zrevrange(LEADERBOARD_KEY, start, stop)]
+        masters = self.queryset.in_bulk(ids)
+        return [masters[master_id] for master_id in ids if master_id in masters]
+
+
+def get_top_masters_leaderboard():
+    """
+    The Redis leaderboard, or while it is being rebuilt the same ordering
+    straight from the database.
+    """
+    if is_leaderboard_built():
+        return TopMastersLeaderboard()
+    schedule_leaderboard_rebuild()
+    return CustomUser.objects.active_masters().for_master_card().annotate(
+        **TOP_RATED_ANNOTATIONS
+    ).order_by(*TOP_RATED_ORDERING)
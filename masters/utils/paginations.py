@@ -1,4 +1,15 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from datetime import date, datetime, timezone
+from django.core.exceptions import ValidationError
+from django.db.models import DateTimeField, FloatField, IntegerField, Q, Value
+from django.db.models.functions import Coalesce
+from drf_yasg import openapi
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomPagination(PageNumberPagination):
@@ -27,3 +38,182 @@ class PaginationForReviewPage(PageNumberPagination):
     page_size = 5
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on the whole `ordering` tuple instead of
+    using OFFSET and COUNT(*), so page 500 costs the same as page 1.
+    The last field of `ordering` must be unique (usually the primary key).
+    `ordering` may name entries of `annotations`, expressions with an
+    explicit output_field that must never be NULL.
+    """
+    ordering = ('-created_at', '-id')
+    annotations = {}
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Kursor düzgün deyil.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.annotate(**self.annotations).order_by(*self.ordering)
+
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        position = [self.get_value(self.page[-1], field.lstrip('-')) for field in self.ordering]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position))
+
+    def get_seek_filter(self, position):
+        """
+        (a, b, c) < (x, y, z) expanded into OR-ed equality prefixes, plus a
+        bound on the leading column so the index range starts at the cursor.
+        """
+        seek = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition = Q(**{f'{name}__{lookup}': position[index]})
+            for previous_field, previous_value in zip(self.ordering[:index], position[:index]):
+                condition &= Q(**{previous_field.lstrip('-'): previous_value})
+            seek |= condition
+
+        leading = self.ordering[0]
+        leading_lookup = 'lte' if leading.startswith('-') else 'gte'
+        return Q(**{f'{leading.lstrip("-")}__{leading_lookup}': position[0]}) & seek
+
+    def get_value(self, obj, field):
+        for attr in field.split('__'):
+            obj = getattr(obj, attr)
+        return obj
+
+    def encode_cursor(self, position):
+        payload = json.dumps(position, default=self._encode_value)
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def get_ordering_field(self, model, field):
+        if field.lstrip('-') in self.annotations:
+            return self.annotations[field.lstrip('-')].output_field
+        names = field.lstrip('-').split('__')
+        for name in names[:-1]:
+            model = model._meta.get_field(name).related_model
+        return model._meta.get_field(names[-1])
+
+    def decode_cursor(self, request, model):
+        """
+        Returns the cursor position with every value converted by its
+        ordering field, so a tampered cursor is a 404 and never reaches
+        the query.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+            position = [
+                self.get_ordering_field(model, field).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+            if any(value is None for value in position):
+                raise ValueError
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    @staticmethod
+    def _encode_value(value):
+        if isinstance(value, date):
+            return value.isoformat()
+        raise TypeError(f'{type(value).__name__} cursor dəyəri kimi istifadə edilə bilməz')
+
+
+class MasterCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for master listings ordered by newest first.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 10
+
+
+# Reytinq cədvəlinin (utils/leaderboard.py) sıralama açarları. Rəy xülasəsi və ya
+# son girişi olmayan usta sıfır sayılır, kursor dəyərləri heç vaxt NULL olmur.
+TOP_RATED_ANNOTATIONS = {
+    'top_ranking_score': Coalesce('rating_summary__ranking_score', Value(0.0), output_field=FloatField()),
+    'top_rating_count': Coalesce('rating_summary__rating_count', Value(0), output_field=IntegerField()),
+    'top_last_login': Coalesce(
+        'last_login', Value(datetime(1970, 1, 1, tzinfo=timezone.utc)), output_field=DateTimeField()
+    ),
+}
+TOP_RATED_ORDERING = ('-top_ranking_score', '-top_rating_count', '-top_last_login', '-id')
+
+
+class TopRatedCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for masters in leaderboard order: ranking score, then
+    review count, then last login.
+    """
+    ordering = TOP_RATED_ORDERING
+    annotations = TOP_RATED_ANNOTATIONS
+    page_size = 8
+
+
+class ReviewCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for review listings ordered by newest first.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 8
+
+
+CURSOR_PAGINATION_PARAMETERS = [
+    openapi.Parameter(
+        'pagination', openapi.IN_QUERY, description="'cursor' — sonsuz siyahı üçün kursor səhifələməsi", type=openapi.TYPE_STRING
+    ),
+    openapi.Parameter(
+        'cursor', openapi.IN_QUERY, description="Əvvəlki cavabdakı `next` linkindən gələn kursor", type=openapi.TYPE_STRING
+    ),
+]
+
+
+def is_cursor_request(request):
+    return (
+        request.query_params.get('pagination') == 'cursor'
+        or KeysetPagination.cursor_query_param in request.query_params
+    )
+
+
+def get_pagination(request, pagination_class, cursor_pagination_class):
+    if is_cursor_request(request):
+        return cursor_pagination_class()
+    return pagination_class()
@@ -0,0 +1,88 @@
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+
+from users.models.user_model import CustomUser
+from users.serializers.profile_serializers import ProfileSerializer
+from users.serializers.work_image_serializers import WorkImageSerializer
+from utils.cache_versions import bump_cache_version, get_cache_version
+from utils.conditional import build_cache_entry
+
+
+def profile_namespace(master_id):
+    return f'master_profile_{master_id}'
+
+
+def _changed_at_key(master_id):
+    return f'master_profile_{master_id}_changed_at'
+
+
+def _last_modified(master):
+    """
+    `updated_at` only moves when the user row is saved; review and image
+    changes are recorded by `invalidate_profiles`.
+    """
+    changed_at = cache.get(_changed_at_key(master.pk))
+    if changed_at is None:
+        return master.updated_at
+    return max(master.updated_at, datetime.fromtimestamp(changed_at, tz=timezone.utc))
+
+
+def _get_entry(master_id, name, build):
+    version = get_cache_version(profile_namespace(master_id))
+    cache_key = f'{name}_{master_id}_v{version}'
+    entry = cache.get(cache_key)
+    if entry is not None:
+        return entry
+
+    entry = build(master_id)
+    if entry is None:
+        return None
+    cache.set(cache_key, entry, timeout=settings.TIMEOUT)
+    return entry
+
+
+def _build_profile_entry(master_id):
+    master = CustomUser.objects.for_profile().filter(id=master_id, is_active=True).first()
+    if master is None:
+        return None
+    return build_cache_entry(ProfileSerializer(master).data, _last_modified(master))
+
+
+def _build_work_images_entry(master_id):
+    master = CustomUser.objects.filter(id=master_id).only('id', 'updated_at').first()
+    if master is None:
+        return None
+    images = master.work_images.all()
+    return build_cache_entry(WorkImageSerializer(images, many=True).data, _last_modified(master))
+
+
+def get_profile_entry(master_id):
+    """
+    Returns the rendered `ProfileSerializer` data of an active user with its
+    validators, from cache when possible. A miss loads the profile in five
+    queries: the user with its rating summary and professions, then
+    languages, cities, districts and work images.
+    """
+    return _get_entry(master_id, 'master_profile', _build_profile_entry)
+
+
+def get_profile_data(master_id):
+    entry = get_profile_entry(master_id)
+    return entry['data'] if entry is not None else None
+
+
+def get_work_images_entry(master_id):
+    return _get_entry(master_id, 'master_work_images', _build_work_images_entry)
+
+
+def invalidate_profiles(*master_ids):
+    master_ids = {master_id for master_id in master_ids if master_id is not None}
+    if not master_ids:
+        return
+    now = time.time()
+    cache.set_many({_changed_at_key(master_id): now for master_id in master_ids}, timeout=None)
+    for master_id in master_ids:
+        bump_cache_version(profile_namespace(master_id))
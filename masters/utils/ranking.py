@@ -0,0 +1,129 @@
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import ExpressionWrapper, F, FloatField, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from reviews.models.rating_model import MasterRating
+from reviews.models.review_models import Review
+
+
+DEFAULT_RANKING = {
+    # Bayes ortalamasında ustaya əlavə edilən "virtual" rəy sayı.
+    'PRIOR_WEIGHT': 10,
+    # Son rəylərdəki teqlərin bonusu: TAG_WEIGHT * log(1 + çəkili teq sayı).
+    'TAG_WEIGHT': 0.1,
+    'TAG_HALF_LIFE_DAYS': 180,
+    'BATCH_SIZE': 1000,
+}
+PRIOR_MEAN_CACHE_KEY = 'ranking:prior_mean'
+
+
+def get_ranking_config():
+    return {**DEFAULT_RANKING, **getattr(settings, 'MASTER_RANKING', {})}
+
+
+def bayesian_average(rating_sum, rating_count, prior_mean, prior_weight):
+    """
+    Works on scalars, numpy arrays and F() expressions alike. A master with
+    few reviews is pulled towards the platform mean, so one 5-star review no
+    longer beats two hundred 4.9-star ones.
+    """
+    return (prior_weight * prior_mean + rating_sum) / (prior_weight + rating_count)
+
+
+def compute_prior_mean():
+    totals = MasterRating.objects.aggregate(
+        rating_sum=Coalesce(Sum('rating_sum'), 0),
+        rating_count=Coalesce(Sum('rating_count'), 0)
+    )
+    if not totals['rating_count']:
+        return 0.0
+    return totals['rating_sum'] / totals['rating_count']
+
+
+def get_prior_mean():
+    prior_mean = cache.get(PRIOR_MEAN_CACHE_KEY)
+    if prior_mean is None:
+        prior_mean = compute_prior_mean()
+        cache.set(PRIOR_MEAN_CACHE_KEY, prior_mean, timeout=None)
+    return prior_mean
+
+
+def score_for(rating_sum, rating_count, tag_score):
+    """
+    Incremental score used when a single master's reviews change; the
+    decayed tag part is kept from the last batch run.
+    """
+    config = get_ranking_config()
+    return bayesian_average(rating_sum, rating_count, get_prior_mean(), config['PRIOR_WEIGHT']) + tag_score
+
+
+def add_decayed_tags(totals, rows, master_index, now, half_life_days):
+    """
+    Adds the tag counts of `rows` (master_id, created_at, tag_mask), each
+    weighted by 0.5 ** (age / half-life), to `totals` in place. Reviews of
+    masters outside `master_index` are skipped.
+    """
+    if not rows:
+        return totals
+    positions = np.fromiter((master_index.get(row[0], -1) for row in rows), dtype=np.int64, count=len(rows))
+    ages = np.fromiter(((now - row[1]).total_seconds() / 86400 for row in rows), dtype=np.float64, count=len(rows))
+    tag_counts = np.fromiter((row[2].bit_count() for row in rows), dtype=np.float64, count=len(rows))
+
+    known = positions >= 0
+    weights = tag_counts[known] * np.power(0.5, np.clip(ages[known], 0, None) / half_life_days)
+    np.add.at(totals, positions[known], weights)
+    return totals
+
+
+def decayed_tag_scores(master_index, now, half_life_days, tag_weight, chunk_size=5000):
+    """
+    Sums every review's decayed tag count per master in one streaming pass
+    over the reviews table; only `chunk_size` rows are held at a time.
+    """
+    totals = np.zeros(len(master_index), dtype=np.float64)
+    rows = Review.objects.filter(tag_mask__gt=0).values_list('master_id', 'created_at', 'tag_mask')
+    chunk = []
+    for row in rows.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            add_decayed_tags(totals, chunk, master_index, now, half_life_days)
+            chunk = []
+    add_decayed_tags(totals, chunk, master_index, now, half_life_days)
+    return tag_weight * np.log1p(totals)
+
+
+def recompute_ranking_scores():
+    """
+    Batch job: recomputes tag_score for every master with vectorized numpy
+    arithmetic and writes it back with bulk_update. ranking_score is then
+    derived in one UPDATE from the rows' current counters, so a review saved
+    while the batch runs is not overwritten with a score from stale counts.
+    """
+    config = get_ranking_config()
+    ratings = list(MasterRating.objects.only('master_id', 'rating_sum', 'rating_count').order_by('master_id'))
+    if not ratings:
+        return 0
+
+    master_index = {rating.master_id: position for position, rating in enumerate(ratings)}
+    rating_sums = np.array([rating.rating_sum for rating in ratings], dtype=np.float64)
+    rating_counts = np.array([rating.rating_count for rating in ratings], dtype=np.float64)
+
+    total_count = rating_counts.sum()
+    prior_mean = float(rating_sums.sum() / total_count) if total_count else 0.0
+    cache.set(PRIOR_MEAN_CACHE_KEY, prior_mean, timeout=None)
+
+    tag_scores = decayed_tag_scores(
+        master_index, timezone.now(), config['TAG_HALF_LIFE_DAYS'], config['TAG_WEIGHT']
+    )
+    for rating, tag_score in zip(ratings, tag_scores.tolist()):
+        rating.tag_score = round(tag_score, 6)
+    MasterRating.objects.bulk_update(ratings, ['tag_score'], batch_size=config['BATCH_SIZE'])
+
+    MasterRating.objects.update(ranking_score=ExpressionWrapper(
+        bayesian_average(F('rating_sum'), F('rating_count'), prior_mean, config['PRIOR_WEIGHT']) + F('tag_score'),
+        output_field=FloatField()
+    ))
+    return len(ratings)
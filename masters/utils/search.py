@@ -0,0 +1,97 @@
+import re
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity
+)
+from django.db.models import F, FloatField, Q, Value
+
+
+SEARCH_CONFIG = 'simple'
+
+# Azərbaycan hərflərini latın qarşılıqlarına endiririk ki, "Məmmədov",
+# "Memmedov" və "memmedov" eyni sənədə düşsün.
+AZ_FOLD_TABLE = str.maketrans({
+    'Ə': 'e', 'ə': 'e',
+    'I': 'i', 'ı': 'i', 'İ': 'i',
+    'Ş': 's', 'ş': 's',
+    'Ç': 'c', 'ç': 'c',
+    'Ğ': 'g', 'ğ': 'g',
+    'Ö': 'o', 'ö': 'o',
+    'Ü': 'u', 'ü': 'u',
+})
+
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def parse_id_list(query_params, param):
+    """
+    Reads multi-select id filters given either as `city_id=1,2,3` or as
+    repeated `city_id=1&city_id=2`. Non-numeric entries are ignored.
+    """
+    ids = set()
+    for raw_value in query_params.getlist(param):
+        for part in raw_value.split(','):
+            part = part.strip()
+            if part.isdigit():
+                ids.add(int(part))
+    return sorted(ids)
+
+
+def parse_number(value, cast=int):
+    try:
+        number = cast(value)
+    except (TypeError, ValueError):
+        return None
+    if number != number or number in (float('inf'), float('-inf')):
+        return None
+    return number
+
+
+def normalize_search_text(value):
+    if not value:
+        return ''
+    folded = str(value).translate(AZ_FOLD_TABLE).lower()
+    return ' '.join(TOKEN_RE.findall(folded))
+
+
+def build_search_text(user):
+    return normalize_search_text(' '.join(filter(None, [
+        user.first_name,
+        user.last_name,
+        user.custom_profession,
+        user.education_speciality,
+    ])))
+
+
+def build_search_vector(user):
+    full_name = normalize_search_text(f'{user.first_name} {user.last_name}')
+    return (
+        SearchVector(Value(full_name), weight='A', config=SEARCH_CONFIG)
+        + SearchVector(Value(normalize_search_text(user.custom_profession)), weight='B', config=SEARCH_CONFIG)
+        + SearchVector(Value(normalize_search_text(user.education_speciality)), weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def search_masters(queryset, term):
+    """
+    Filters masters by full-text prefix match or trigram word similarity
+    (typo tolerance) and annotates `search_rank` for ordering.
+    """
+    folded = normalize_search_text(term)
+    if not folded:
+        # Yalnız durğu işarələrindən ibarət sorğu heç nəyə uyğun gəlmir,
+        # amma view yenə də search_rank üzrə sıralayır.
+        return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    query = SearchQuery(
+        ' & '.join(f'{token}:*' for token in folded.split()),
+        search_type='raw',
+        config=SEARCH_CONFIG
+    )
+    return queryset.filter(
+        Q(search_document=query) | Q(search_text__trigram_word_similar=folded)
+    ).annotate(
+        search_rank=SearchRank(F('search_document'), query) + TrigramWordSimilarity(folded, 'search_text')
+    )
@@ -0,0 +1,188 @@
+import hashlib
+import json
+from urllib.parse import urlencode
+
+from django.conf import settings
+
+from utils.cache_versions import bump_cache_version, get_cache_versions
+from utils.search import normalize_search_text, parse_id_list, parse_number
+
+
+SEARCH_CACHE_TIMEOUT = 60 * 60 * 24
+SEARCH_CACHE_STATS_KEY = 'search_cache:stats'
+
+SEARCH_EXACT_PARAMS = ('profession_area_id', 'profession_speciality_id', 'near_city_id', 'near_district_id', 'page')
+SEARCH_INTEGER_PARAMS = ('experience_years', 'experience_min', 'experience_max', 'page_size')
+SEARCH_MULTI_ID_PARAMS = ('city_id', 'language_id')
+SEARCH_ORDERING_FIELDS = ('id', 'first_name', 'last_name', 'experience_years', 'created_at', 'rating', 'score')
+DEFAULT_SEARCH_ORDERING = '-id'
+# Boş olmayan, amma heç bir söz saxlamayan axtarış (məs. "!!!") heç nəyə uyğun
+# gəlmir; açarda axtarışsız siyahıdan fərqlənməlidir. Qatlanmış mətndə "!" olmur.
+UNMATCHABLE_SEARCH = '!'
+
+# Axtarış parametri -> asılılıq teqinin prefiksi.
+SEARCH_TAG_PARAMS = {
+    'profession_area_id': 'area',
+    'profession_speciality_id': 'speciality',
+    'city_id': 'city',
+    'language_id': 'language',
+}
+
+
+def canonical_search_params(query_params, pagination):
+    """
+    Reduces a search query string to the values the view actually acts on:
+    unknown and empty parameters are dropped, integers are coerced, the
+    search term is folded like the search document (a term with no words
+    left becomes `UNMATCHABLE_SEARCH`, as the view returns nothing for it)
+    and defaults (page 1, default page size, '-id' ordering) are removed.
+    """
+    params = {}
+
+    raw_search = query_params.get('search')
+    search = normalize_search_text(raw_search) or (UNMATCHABLE_SEARCH if raw_search else '')
+    if search:
+        params['search'] = search
+
+    education = (query_params.get('education') or '').strip()
+    if education:
+        params['education'] = education
+
+    for param in SEARCH_EXACT_PARAMS:
+        raw_value = (query_params.get(param) or '').strip()
+        if not raw_value:
+            continue
+        value = parse_number(raw_value)
+        # Yanlış dəyəri xam saxlayırıq ki, düzgün sorğunun keşinə düşməsin.
+        params[param] = raw_value if value is None else value
+
+    for param in SEARCH_INTEGER_PARAMS:
+        value = parse_number(query_params.get(param))
+        if value is not None:
+            params[param] = value
+
+    for param in SEARCH_MULTI_ID_PARAMS:
+        ids = parse_id_list(query_params, param)
+        if ids:
+            params[param] = ids
+
+    min_rating = parse_number(query_params.get('min_rating'), float)
+    if min_rating is not None:
+        params['min_rating'] = min_rating
+
+    if params.get('page') == 1:
+        del params['page']
+    page_size = params.pop('page_size', None)
+    if isinstance(page_size, int) and page_size > 0:
+        page_size = min(page_size, pagination.max_page_size)
+        if page_size != pagination.page_size:
+            params['page_size'] = page_size
+
+    ordering = query_params.get('ordering')
+    if ordering is not None:
+        if ordering.lstrip('-') not in SEARCH_ORDERING_FIELDS:
+            ordering = DEFAULT_SEARCH_ORDERING
+        # Axtarış sözü və ya yaxınlıq sırası varsa, ordering=-id onları
+        # əvəz edir, ona görə atmırıq.
+        proximity = 'near_city_id' in params or 'near_district_id' in params
+        if ordering != DEFAULT_SEARCH_ORDERING or search or proximity:
+            params['ordering'] = ordering
+
+    return params
+
+
+def search_tags(params):
+    """
+    Tags a cached search page depends on. A page filtered by a dimension can
+    only change when a master carrying that tag changes; unfiltered pages
+    depend on every master and use the catch-all 'all' tag.
+    """
+    tags = sorted(
+        f'{prefix}:{value}'
+        for param, prefix in SEARCH_TAG_PARAMS.items()
+        if param in params
+        for value in (params[param] if isinstance(params[param], list) else [params[param]])
+    )
+    return tags or ['all']
+
+
+def _tag_namespace(tag):
+    return f'search_tag_{tag}'
+
+
+def facet_tags(params):
+    """
+    Each facet is counted without its own filter, so with a single tagged
+    filter the counts depend on masters outside it as well. With two or more
+    dimensions, any master a facet can count still carries one of the tags.
+    """
+    if len([param for param in SEARCH_TAG_PARAMS if param in params]) < 2:
+        return ['all']
+    return search_tags(params)
+
+
+def build_search_cache_key(params, tags=None, prefix='search'):
+    """
+    Folds the current generation of every tag into the key, so bumping a tag
+    makes the old entries unreachable without scanning Redis.
+    """
+    if tags is None:
+        tags = search_tags(params)
+    versions = get_cache_versions([_tag_namespace(tag) for tag in tags])
+    payload = json.dumps([urlencode(sorted(params.items()), doseq=True), sorted(versions.items())])
+    return f'{prefix}_{hashlib.md5(payload.encode()).hexdigest()}'
+
+
+def master_search_tags(master, previous_values=None):
+    previous_values = previous_values or {}
+    tags = {'all'}
+    for attname, prefix in (('profession_area_id', 'area'), ('profession_speciality_id', 'speciality')):
+        for value in (getattr(master, attname), previous_values.get(attname)):
+            if value is not None:
+                tags.add(f'{prefix}:{value}')
+    if master.pk is not None:
+        tags.update(f'city:{city_id}' for city_id in master.cities.values_list('id', flat=True))
+        tags.update(f'language:{language_id}' for language_id in master.languages.values_list('id', flat=True))
+    return tags
+
+
+def masters_search_tags(masters):
+    """
+    `master_search_tags` for every master of the `masters` queryset, in
+    three queries.
+    """
+    tags = {'all'}
+    for area_id, speciality_id in masters.values_list('profession_area_id', 'profession_speciality_id'):
+        tags.update(
+            f'{prefix}:{value}'
+            for prefix, value in (('area', area_id), ('speciality', speciality_id))
+            if value is not None
+        )
+    for relation, prefix in (('cities', 'city'), ('languages', 'language')):
+        tags.update(
+            f'{prefix}:{value}'
+            for value in masters.values_list(relation, flat=True).distinct()
+            if value is not None
+        )
+    return tags
+
+
+def invalidate_search_tags(tags):
+    for tag in set(tags):
+        bump_cache_version(_tag_namespace(tag))
+
+
+def record_search_cache_hit(hit):
+    settings.REDIS_CLIENT.hincrby(SEARCH_CACHE_STATS_KEY, 'hits' if hit else 'misses', 1)
+
+
+def get_search_cache_stats():
+    stats = settings.REDIS_CLIENT.hgetall(SEARCH_CACHE_STATS_KEY)
+    hits = int(stats.get('hits', 0))
+    misses = int(stats.get('misses', 0))
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+    }
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+
+from reviews.models.rating_model import MasterRating
+from services.models.category_model import Category
+from users.models.user_model import CustomUser
+
+
+STATISTICS_KEY = 'statistics:platform'
+STATISTICS_FIELDS = ('master_count', 'category_count', 'rating_sum', 'rating_count')
+
+
+def increment_statistic(field, amount=1):
+    """
+    Applies a counter change once the surrounding transaction commits, so a
+    rolled back save never leaks into the homepage numbers.
+    """
+    if not amount:
+        return
+    transaction.on_commit(lambda: settings.REDIS_CLIENT.hincrby(STATISTICS_KEY, field, amount))
+
+
+def compute_statistics():
+    ratings = MasterRating.objects.aggregate(
+        rating_sum=Coalesce(Sum('rating_sum'), 0),
+        rating_count=Coalesce(Sum('rating_count'), 0)
+    )
+    return {
+        'master_count': CustomUser.objects.active_masters().count(),
+        'category_count': Category.objects.count(),
+        **ratings,
+    }
+
+
+def reconcile_statistics():
+    values = compute_statistics()
+    settings.REDIS_CLIENT.hset(STATISTICS_KEY, mapping=values)
+    return values
+
+
+def get_statistics():
+    values = settings.REDIS_CLIENT.hgetall(STATISTICS_KEY)
+    if not all(field in values for field in STATISTICS_FIELDS):
+        return reconcile_statistics()
+    return {field: int(values[field]) for field in STATISTICS_FIELDS}
@@ -0,0 +1,208 @@
+import json
+import os
+import posixpath
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from django.utils.module_loading import import_string
+from PIL import Image
+from rest_framework import serializers
+
+from utils.images import STORAGE_SOURCE_PREFIX, queue_images, stage_upload, temp_storage
+
+
+DEFAULT_IMAGE_UPLOADS = {
+    'BACKEND': 'utils.uploads.S3UploadBackend',
+    'SLOT_TTL': 15 * 60,
+    'MAX_SIZE': 5 * 1024 * 1024,
+}
+UPLOAD_KINDS = ('profile', 'work', 'review')
+UPLOAD_CONTENT_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png'}
+# İş və rəy şəkilləri emal tapşırığında yenidən kodlanır, profil şəkli isə
+# olduğu kimi saxlanılır, ona görə təsdiqdə açılıb yoxlanılır.
+VERIFIED_UPLOAD_KINDS = ('profile',)
+
+
+def get_upload_config():
+    return {**DEFAULT_IMAGE_UPLOADS, **getattr(settings, 'IMAGE_UPLOADS', {})}
+
+
+def _slot_key(upload_id):
+    return f'upload_slot:{upload_id}'
+
+
+class S3UploadBackend:
+    """
+    The client POSTs the file straight to the bucket with a presigned form.
+    Works against any S3-compatible API; point AWS_S3_ENDPOINT_URL at MinIO
+    to run it locally.
+    """
+    def __init__(self):
+        self.storage = default_storage
+
+    def _key(self, name):
+        location = getattr(self.storage, 'location', '')
+        return posixpath.join(location, name) if location else name
+
+    def presign(self, slot, request):
+        config = get_upload_config()
+        post = self.storage.bucket.meta.client.generate_presigned_post(
+            Bucket=self.storage.bucket_name,
+            Key=self._key(slot['name']),
+            Fields={'Content-Type': slot['content_type']},
+            Conditions=[
+                {'Content-Type': slot['content_type']},
+                ['content-length-range', 1, slot['max_size']],
+            ],
+            ExpiresIn=config['SLOT_TTL']
+        )
+        return {'method': 'POST', 'url': post['url'], 'fields': post['fields']}
+
+    def uploaded_size(self, slot):
+        if not self.storage.exists(slot['name']):
+            return None
+        return self.storage.size(slot['name'])
+
+    def pending_name(self, slot):
+        # Emal tapşırığı faylı media yaddaşından oxuyur.
+        return f"{STORAGE_SOURCE_PREFIX}{slot['name']}"
+
+    def attach(self, field_file, slot):
+        # Fayl artıq media yaddaşındadır, yalnız adı yazılır.
+        field_file.name = slot['name']
+
+
+class LocalUploadBackend:
+    """
+    Stand-in for development and tests: the client PUTs the file to
+    `UploadFileAPIView`, which writes it to the local temp storage.
+    """
+    def __init__(self):
+        self.storage = temp_storage()
+
+    def presign(self, slot, request):
+        url = reverse('upload_apis:upload-file', kwargs={'upload_id': slot['id']})
+        return {'method': 'PUT', 'url': request.build_absolute_uri(url), 'fields': {}}
+
+    def receive(self, slot, content):
+        if self.storage.exists(slot['name']):
+            self.storage.delete(slot['name'])
+        self.storage.save(slot['name'], content)
+
+    def uploaded_size(self, slot):
+        if not self.storage.exists(slot['name']):
+            return None
+        return self.storage.size(slot['name'])
+
+    def pending_name(self, slot):
+        return slot['name']
+
+    def attach(self, field_file, slot):
+        with self.storage.open(slot['name'], 'rb') as content:
+            field_file.save(os.path.basename(slot['name']), content, save=False)
+        self.storage.delete(slot['name'])
+
+
+def get_upload_backend():
+    return import_string(get_upload_config()['BACKEND'])()
+
+
+def create_upload_slot(kind, filename, size, request):
+    """
+    Reserves an upload id in Redis and returns where and how the client
+    should send the file.
+    """
+    config = get_upload_config()
+    extension = os.path.splitext(filename)[1].lower()
+    if kind not in UPLOAD_KINDS:
+        raise serializers.ValidationError({'kind': f"Yalnız bu növlər: {', '.join(UPLOAD_KINDS)}"})
+    if extension not in UPLOAD_CONTENT_TYPES:
+        raise serializers.ValidationError({'filename': 'Yalnız JPG və PNG formatları dəstəklənir.'})
+    if size > config['MAX_SIZE']:
+        raise serializers.ValidationError({'size': 'Şəkil 5 MB-dan böyük ola bilməz.'})
+
+    upload_id = uuid.uuid4().hex
+    slot = {
+        'id': upload_id,
+        'kind': kind,
+        'name': f'uploads/{kind}/{upload_id}{extension}',
+        'content_type': UPLOAD_CONTENT_TYPES[extension],
+        'max_size': config['MAX_SIZE'],
+    }
+    settings.REDIS_CLIENT.set(_slot_key(upload_id), json.dumps(slot), ex=config['SLOT_TTL'])
+    return {
+        'upload_id': upload_id,
+        'expires_in': config['SLOT_TTL'],
+        **get_upload_backend().presign(slot, request),
+    }
+
+
+def get_upload_slot(upload_id):
+    data = settings.REDIS_CLIENT.get(_slot_key(upload_id))
+    return json.loads(data) if data else None
+
+
+def verify_uploaded_image(backend, slot):
+    """
+    The checks the multipart path gets from `ImageField`: the file must open
+    in Pillow, pass `verify()` and be the JPEG or PNG the slot was issued
+    for. A file that fails is deleted.
+    """
+    try:
+        with backend.storage.open(slot['name'], 'rb') as content:
+            image = Image.open(content)
+            image.verify()
+        valid = Image.MIME.get(image.format) == slot['content_type']
+    except Exception:
+        valid = False
+    if not valid:
+        backend.storage.delete(slot['name'])
+        raise serializers.ValidationError(f"{slot['id']}: fayl şəkil deyil və ya zədəlidir. Yalnız JPG və PNG formatları dəstəklənir.")
+
+
+def validate_uploads(upload_ids, kind):
+    """
+    Serializer-side confirmation: every id must be an unexpired slot of
+    `kind` whose file has actually arrived in storage. Repeated ids count
+    once. Returns the slots.
+    """
+    backend = get_upload_backend()
+    slots = []
+    for upload_id in dict.fromkeys(upload_ids):
+        slot = get_upload_slot(upload_id)
+        if slot is None or slot['kind'] != kind:
+            raise serializers.ValidationError(f'{upload_id}: yükləmə tapılmadı və ya vaxtı bitib.')
+        size = backend.uploaded_size(slot)
+        if size is None:
+            raise serializers.ValidationError(f'{upload_id}: fayl hələ yüklənməyib.')
+        if size > slot['max_size']:
+            raise serializers.ValidationError(f'{upload_id}: şəkil 5 MB-dan böyük ola bilməz.')
+        if kind in VERIFIED_UPLOAD_KINDS:
+            verify_uploaded_image(backend, slot)
+        slots.append(slot)
+    return slots
+
+
+def _release(slot):
+    settings.REDIS_CLIENT.delete(_slot_key(slot['id']))
+
+
+def create_images(model, files=(), slots=(), **fields):
+    """
+    Creates image rows for multipart `files` and confirmed upload `slots`
+    in one batch and hands them to the image pipeline, see `queue_images`.
+    """
+    backend = get_upload_backend() if slots else None
+    temp_names = [stage_upload(uploaded_file) for uploaded_file in files]
+    temp_names += [backend.pending_name(slot) for slot in slots]
+    images = queue_images(model, temp_names, **fields)
+    if slots:
+        settings.REDIS_CLIENT.delete(*[_slot_key(slot['id']) for slot in slots])
+    return images
+
+
+def attach_upload(field_file, slot):
+    get_upload_backend().attach(field_file, slot)
+    _release(slot)